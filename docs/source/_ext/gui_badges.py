@@ -0,0 +1,38 @@
+"""Sphinx extension registering the GUI badge roles used throughout the docs.
+
+Registering the roles once at startup replaces the ``rst_prolog`` role
+directives, which docutils had to re-parse for every source document.
+"""
+
+from docutils import nodes
+
+# role name -> CSS classes (see _static/custom.css)
+GUI_ROLES = {
+    "gui-badge-crossref": ["badge", "badge-source-crossref"],
+    "gui-badge-arxiv": ["badge", "badge-source-arxiv"],
+    "gui-badge-scholar": ["badge", "badge-source-semantic-scholar"],
+    "gui-badge-dblp": ["badge", "badge-source-dblp"],
+    "gui-badge-pubmed": ["badge", "badge-source-pubmed"],
+    "gui-badge-zenodo": ["badge", "badge-source-zenodo"],
+    "gui-badge-datacite": ["badge", "badge-source-datacite"],
+    "gui-badge-openalex": ["badge", "badge-source-openalex"],
+    "gui-status-review": ["badge", "badge-status-review"],
+    "gui-status-conflict": ["badge", "badge-status-conflict"],
+    "gui-status-different": ["badge", "badge-status-different"],
+    "gui-status-identical": ["badge", "badge-status-identical"],
+    "gui-btn-accept": ["badge", "badge-status-accepted"],
+    "gui-btn-reject": ["badge", "badge-status-rejected"],
+}
+
+
+def _make_role(classes):
+    def role(name, rawtext, text, lineno, inliner, options=None, content=None):
+        return [nodes.inline(rawtext, text, classes=list(classes))], []
+
+    return role
+
+
+def setup(app):
+    for name, classes in GUI_ROLES.items():
+        app.add_role(name, _make_role(classes))
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
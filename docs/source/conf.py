@@ -1,10 +1,10 @@
 import os
 import sys
-from datetime import date
+import time
 
 # -- Project information -----------------------------------------------------
 project = "BibTeX Validator"
-copyright = f"{date.today().year}, Wonjun Choi"
+copyright = f"{time.gmtime().tm_year}, Wonjun Choi"
 author = "Wonjun Choi"
 release = "1.0.0"
 
@@ -14,20 +14,24 @@ extensions = [
     "sphinx.ext.autodoc",
     "sphinx.ext.napoleon",
     "sphinx.ext.viewcode",
-    "sphinx.ext.githubpages",
     "sphinx.ext.intersphinx",
-    "sphinx.ext.todo",
-    "sphinx.ext.mathjax",
     "sphinx_copybutton",
     "sphinx_design",
-    "sphinx_tabs.tabs",
-    "sphinxext.opengraph",
-    "sphinx_sitemap",
     "sphinxcontrib.mermaid",
-    "sphinxext.rediraffe",
-    "sphinx_last_updated_by_git",
+    "gui_badges",
 ]
 
+# Extensions that only matter for the published site (Pages metadata, social
+# cards, sitemap, per-page `git log` timestamps) are not imported for local
+# builds. They are enabled on CI or when DOCS_DEPLOY is set.
+if os.environ.get("CI") or os.environ.get("DOCS_DEPLOY"):
+    extensions += [
+        "sphinx.ext.githubpages",
+        "sphinxext.opengraph",
+        "sphinx_sitemap",
+        "sphinx_last_updated_by_git",
+    ]
+
 templates_path = ["_templates"]
 exclude_patterns = []
 
@@ -73,7 +77,8 @@ myst_heading_anchors = 3
 # -- Path setup --------------------------------------------------------------
 # If extensions (or modules to document with autodoc) are in another directory,
 # add these directories to sys.path here.
-sys.path.insert(0, os.path.abspath("../.."))
+# ("_ext" holds local extensions such as the GUI badge roles.)
+sys.path[:0] = [os.path.abspath("_ext"), os.path.abspath("../..")]
 
 # -- Options for sphinx-sitemap ----------------------------------------------
 # GitHub Pages URL 설정 (실제 배포 URL로 변경 필요)
@@ -89,18 +94,12 @@ ogp_image = f"{html_baseurl}_static/og-image.png"  # 선택사항: 이미지가
 
 # -- Options for sphinx.ext.intersphinx -------------------------------------
 # 외부 프로젝트 문서와의 상호 참조 설정
+# autodoc 타입 힌트에서 참조하는 Python 표준 문서만 사용
+# `make update-inv`로 받아 둔 로컬 objects.inv를 먼저 읽고, 없으면 원격에서 가져옴
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3", None),
-    "bibtexparser": ("https://bibtexparser.readthedocs.io/en/stable/", None),
-    "requests": ("https://requests.readthedocs.io/en/stable/", None),
-    "fastapi": ("https://fastapi.tiangolo.com/", None),
+    "python": ("https://docs.python.org/3", ("_inv/python.inv", None)),
 }
 
-# -- Options for sphinx.ext.todo ---------------------------------------------
-# TODO 항목 표시 설정
-todo_include_todos = True
-todo_link_only = False
-
 # -- Options for sphinx-last-updated-by-git ----------------------------------
 # Git 기반 마지막 업데이트 시간 표시
 git_last_updated_timezone = "Asia/Seoul"
@@ -111,48 +110,3 @@ git_last_updated_timezone = "Asia/Seoul"
 # mermaid_output_format = 'png'  # 또는 'svg'
 # mermaid_cmd = 'mmdc'  # mermaid-cli가 설치된 경우에만 사용
 
-
-# -- Custom Roles Setup (GUI Visuals) ---------------------------------------
-rst_prolog = """
-.. role:: gui-badge-crossref
-   :class: badge badge-source-crossref
-
-.. role:: gui-badge-arxiv
-   :class: badge badge-source-arxiv
-
-.. role:: gui-badge-scholar
-   :class: badge badge-source-semantic-scholar
-
-.. role:: gui-badge-dblp
-   :class: badge badge-source-dblp
-
-.. role:: gui-badge-pubmed
-   :class: badge badge-source-pubmed
-
-.. role:: gui-badge-zenodo
-   :class: badge badge-source-zenodo
-
-.. role:: gui-badge-datacite
-   :class: badge badge-source-datacite
-
-.. role:: gui-badge-openalex
-   :class: badge badge-source-openalex
-
-.. role:: gui-status-review
-   :class: badge badge-status-review
-
-.. role:: gui-status-conflict
-   :class: badge badge-status-conflict
-
-.. role:: gui-status-different
-   :class: badge badge-status-different
-
-.. role:: gui-status-identical
-   :class: badge badge-status-identical
-
-.. role:: gui-btn-accept
-   :class: badge badge-status-accepted
-
-.. role:: gui-btn-reject
-   :class: badge badge-status-rejected
-"""
@@ -14,15 +14,23 @@ import re
 import sys
 import os
 import time
+import json
+import sqlite3
+import functools
+import hashlib
+import html
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import quote, urlsplit
+from typing import Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from datetime import datetime
 import threading
 import pickle
+import queue
 import tempfile
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import namedtuple
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 try:
     import bibtexparser
@@ -35,11 +43,41 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 
     HAS_REQUESTS = True
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    HAS_ORJSON = True
+except ImportError:
+    json_loads = json.loads
+    json_dumps = json.dumps
+    HAS_ORJSON = False
+
+try:
+    from lxml import etree as lxml_etree
+
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+try:
+    from rapidfuzz.fuzz import token_set_ratio, token_sort_ratio
+
+    HAS_RAPIDFUZZ = True
+except ImportError:
+    HAS_RAPIDFUZZ = False
+
 try:
     from scholarly import scholarly
 
@@ -49,7 +87,15 @@ except ImportError:
 
 try:
     from fastapi import FastAPI, Request, HTTPException
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.middleware.gzip import GZipMiddleware
+    from fastapi.responses import HTMLResponse, JSONResponse, Response
+
+    if HAS_ORJSON:
+        # Encodes straight to bytes with orjson. Defined here rather than
+        # using fastapi's ORJSONResponse, which newer releases deprecate.
+        class JSONResponse(JSONResponse):
+            def render(self, content) -> bytes:
+                return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
     import uvicorn
     import webbrowser
     import threading
@@ -62,14 +108,67 @@ except ImportError:
         from fastapi import FastAPI
 
 
-@dataclass
+# Namespaces used by the arXiv Atom API
+ARXIV_NS = {
+    "atom": "http://www.w3.org/2005/Atom",
+    "arxiv": "http://arxiv.org/schemas/atom",
+}
+
+if HAS_LXML:
+    XML_PARSE_ERRORS = (ET.ParseError, lxml_etree.XMLSyntaxError)
+else:
+    XML_PARSE_ERRORS = (ET.ParseError,)
+
+if not HAS_RAPIDFUZZ:
+    from difflib import SequenceMatcher
+
+    def token_sort_ratio(s1: str, s2: str) -> float:
+        """Pure-Python stand-in for ``rapidfuzz.fuzz.token_sort_ratio`` (0-100)"""
+        sorted1 = " ".join(sorted(s1.split()))
+        sorted2 = " ".join(sorted(s2.split()))
+        return SequenceMatcher(None, sorted1, sorted2, autojunk=False).ratio() * 100
+
+    def token_set_ratio(s1: str, s2: str) -> float:
+        """Pure-Python stand-in for ``rapidfuzz.fuzz.token_set_ratio`` (0-100)"""
+        tokens1 = set(s1.split())
+        tokens2 = set(s2.split())
+        if not tokens1 or not tokens2:
+            return 0.0
+        common = " ".join(sorted(tokens1 & tokens2))
+        diff1 = " ".join(sorted(tokens1 - tokens2))
+        diff2 = " ".join(sorted(tokens2 - tokens1))
+        # One token set contained in the other counts as a full match
+        if common and (not diff1 or not diff2):
+            return 100.0
+        combined1 = f"{common} {diff1}" if common else diff1
+        combined2 = f"{common} {diff2}" if common else diff2
+        # The shared tokens are a prefix of both combined strings, so their
+        # ratio against either one is known without running the matcher
+        best = 0.0
+        if common:
+            shorter = min(len(combined1), len(combined2))
+            best = 2 * len(common) / (len(common) + shorter)
+        matcher = SequenceMatcher(None, combined1, combined2, autojunk=False)
+        # quick_ratio() is an upper bound on ratio(); skip the full match if
+        # it cannot beat the prefix ratio
+        if matcher.quick_ratio() > best:
+            best = max(best, matcher.ratio())
+        return best * 100
+
+
+# Per-entry records are created in large numbers, so drop their instance
+# __dict__ where dataclasses support it (Python 3.10+)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class BibEntry:
     entry_type: str
     citekey: str
     fields: Dict[str, str]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LintMessage:
     level: str  # "error", "warning", "info"
     code: str
@@ -77,7 +176,27 @@ class LintMessage:
     field: Optional[str] = None
 
 
-@dataclass
+# Outcome of comparing one field against the API data
+# status: "updated" (API fills a missing field), "conflict", "different"
+# (minor difference) or "identical"; bib is None for "updated"
+FieldDiff = namedtuple("FieldDiff", "status bib api source")
+
+# Key under which the GUI API reports the fields of each status
+STATUS_KEYS = {
+    "updated": "fields_updated",
+    "conflict": "fields_conflict",
+    "different": "fields_different",
+    "identical": "fields_identical",
+}
+
+# Fixed DOI status lines of the per-entry report
+REPORT_DOI_VALID = "  DOI: ✓ Valid"
+REPORT_DOI_INVALID = "  DOI: ✗ Invalid/Not found"
+REPORT_DOI_MISSING = "  DOI: Not provided"
+REPORT_ARXIV_MISSING = "  arXiv: Not provided"
+
+
+@dataclass(**_SLOTS)
 class ValidationResult:
     """Stores validation results for a single entry"""
 
@@ -94,18 +213,9 @@ class ValidationResult:
     lint_messages: List[LintMessage] = field(default_factory=list)
 
     fields_missing: List[str] = field(default_factory=list)
-    fields_updated: Dict[str, Tuple[str, str]] = field(
-        default_factory=dict
-    )  # field: (old_value, new_value)
-    fields_conflict: Dict[str, Tuple[str, str]] = field(
-        default_factory=dict
-    )  # field: (bibtex_value, api_value)
-    fields_identical: Dict[str, str] = field(
+    field_status: Dict[str, FieldDiff] = field(
         default_factory=dict
-    )  # field: value (same in both)
-    fields_different: Dict[str, Tuple[str, str]] = field(
-        default_factory=dict
-    )  # field: (bibtex_value, api_value) - minor differences
+    )  # field: FieldDiff(status, bibtex_value, api_value, source)
     field_sources: Dict[str, str] = field(
         default_factory=dict
     )  # field: "crossref"|"arxiv"|"scholar"|"dblp"|"semantic_scholar"|"pubmed"
@@ -121,6 +231,174 @@ class ValidationResult:
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
 
+    def fields_with(self, status: str) -> Dict[str, FieldDiff]:
+        """Fields whose comparison outcome is ``status``"""
+        return {f: d for f, d in self.field_status.items() if d.status == status}
+
+    def clear_suggestions(self):
+        """Drop pending updates, conflicts and differences; keep identical fields"""
+        self.field_status = {
+            f: d for f, d in self.field_status.items() if d.status == "identical"
+        }
+
+
+class DiskCache:
+    """
+    Persistent SQLite cache for API responses.
+
+    Values are stored as JSON and expire after ``ttl`` seconds. Negative
+    results (``None``) are stored too but expire after ``negative_ttl``
+    seconds so that missing records are retried sooner. An expired value
+    stored with its response's ETag can be revalidated instead of refetched.
+    """
+
+    def __init__(
+        self, path: Path, ttl: float = 90 * 24 * 3600, negative_ttl: float = 24 * 3600
+    ):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT, ts REAL, etag TEXT)"
+        )
+        # Caches written before ETags were kept lack the column
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(cache)")}
+        if "etag" not in columns:
+            self.conn.execute("ALTER TABLE cache ADD COLUMN etag TEXT")
+
+    def get(self, key: str) -> Tuple[bool, Optional[Dict]]:
+        """Return (hit, value) for key"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, ts FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return False, None
+        value, ts = row
+        ttl = self.negative_ttl if value is None else self.ttl
+        if time.time() - ts > ttl:
+            return False, None
+        if value is None:
+            return True, None
+        return True, json_loads(value)
+
+    def get_stale(self, key: str) -> Optional[Tuple[str, Dict]]:
+        """Return (etag, value) of a stored value that can be revalidated"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT value, etag FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] is None or not row[1]:
+            return None
+        return row[1], json_loads(row[0])
+
+    def set(self, key: str, value: Optional[Dict], etag: Optional[str] = None):
+        """Store value (None for a negative result) under key"""
+        data = json_dumps(value) if value is not None else None
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, ts, etag) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, time.time(), etag),
+            )
+
+    def touch(self, key: str):
+        """Mark a revalidated value as fresh again"""
+        with self.lock:
+            self.conn.execute(
+                "UPDATE cache SET ts = ? WHERE key = ?", (time.time(), key)
+            )
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
+
+
+def _cache_key(namespace: str, args: tuple, kwargs: dict) -> str:
+    return f"{namespace}:{json.dumps([args, kwargs], sort_keys=True)}"
+
+
+def cached(namespace: str):
+    """
+    Cache a fetch_* method's result in the validator's DiskCache.
+
+    The key is ``namespace`` plus the call arguments. Results are not stored
+    when the fetch hit a transient failure (network error, rate limit, 5xx).
+    If an expired result has an ETag, the fetch can send it back (see
+    ``_revalidation_headers``) and, on a 304, reuse the stored value.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if self.cache is None:
+                return func(self, *args, **kwargs)
+
+            key = _cache_key(namespace, args, kwargs)
+            hit, value = self.cache.get(key)
+            if hit:
+                return value
+
+            state = self._fetch_state
+            state.transient = False
+            state.not_modified = False
+            state.response_etag = None
+            state.etag, state.stale = self.cache.get_stale(key) or (None, None)
+            try:
+                value = func(self, *args, **kwargs)
+            finally:
+                state.etag = state.stale = None
+
+            if state.not_modified:
+                self.cache.touch(key)
+            elif value is not None or not state.transient:
+                self.cache.set(key, value, state.response_etag)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+class RateLimiter:
+    """
+    Rate limiter shared by all worker threads.
+
+    Each caller is given the next free time slot on the monotonic clock and
+    sleeps only until then, outside the lock. Slots are spaced ``1 / rate``
+    seconds apart, and up to ``capacity`` calls may go out back to back after
+    an idle period. Because slots are scheduled from the previous request's
+    start, time already spent waiting on a slow response counts towards the
+    spacing instead of being followed by a full fixed sleep.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1):
+        self.interval = 1.0 / rate
+        self.burst = (capacity - 1) * self.interval
+        self.next_slot = time.monotonic() - self.burst
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Wait for the next free slot"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now - self.burst)
+            sleep_for = max(0.0, slot - now)
+            self.next_slot = slot + self.interval
+        if sleep_for:
+            time.sleep(sleep_for)
+
+    def pause(self, seconds: float):
+        """Hold back every caller's next slot for at least ``seconds``"""
+        with self.lock:
+            self.next_slot = max(self.next_slot, time.monotonic() + seconds)
+
 
 class BibTeXValidator:
     """Validates and enriches BibTeX entries"""
@@ -317,6 +595,161 @@ class BibTeXValidator:
     # arXiv ID patterns
     ARXIV_NOTE_PATTERN = re.compile(r"(?i)arxiv:\s*(\d{4}\.\d{4,5}(?:v\d+)?)")
     ARXIV_DOI_PATTERN = re.compile(r"10\.48550/ARXIV\.(\d{4}\.\d{4,5})", re.IGNORECASE)
+    ARXIV_EPRINT_PATTERN = re.compile(r"(\d{4}\.\d{4,5})(?:v\d+)?")
+    ARXIV_VERSION_PATTERN = re.compile(r"v\d+$")
+    ARXIV_ABS_PATTERN = re.compile(r"arxiv\.org/abs/(\d{4}\.\d{4,5})")
+
+    # Element patterns for scanning the first <entry> of an arXiv Atom feed
+    # as text, keyed by the field they fill in
+    ARXIV_FEED_PATTERNS = {
+        "title": re.compile(r"<title>([^<]+)</title>"),
+        "authors": re.compile(r"<name>([^<]+)</name>"),
+        "published": re.compile(r"<published>([^<]+)</published>"),
+        "id": re.compile(r"<id>([^<]+)</id>"),
+        "categories": re.compile(r'<category term="([^"]+)"'),
+        "journal_ref": re.compile(
+            r"<arxiv:journal_ref[^>]*>([^<]+)</arxiv:journal_ref>"
+        ),
+        "doi": re.compile(r"<arxiv:doi[^>]*>([^<]+)</arxiv:doi>"),
+    }
+    # Opening tags whose presence means the matching pattern must have matched
+    ARXIV_FEED_TAGS = {
+        "title": "<title",
+        "authors": "<name",
+        "published": "<published",
+        "id": "<id",
+        "categories": "<category",
+        "journal_ref": "<arxiv:journal_ref",
+        "doi": "<arxiv:doi",
+    }
+
+    # DOI and other identifier patterns
+    DOI_URL_PATTERN = re.compile(r"https?://(?:dx\.)?doi\.org/(10\..+)", re.IGNORECASE)
+    DOI_STRIP_PATTERN = re.compile(
+        r"^\s*(?:https?://(?:dx\.)?doi\.org/|doi:\s*)", re.IGNORECASE
+    )
+    ZENODO_RECORD_PATTERN = re.compile(r"zenodo\.(\d+)")
+    YEAR_PATTERN = re.compile(r"\d{4}")
+    # str.translate tables deleting LaTeX grouping braces (plus ISSN hyphens)
+    LATEX_BRACE_TABLE = str.maketrans("", "", "{}")
+    ISSN_STRIP_TABLE = str.maketrans("", "", "{}-")
+    # Fields compared case-insensitively
+    CASE_INSENSITIVE_FIELDS = frozenset({"title", "doi", "author", "journal"})
+
+    # Keywords suggesting venue information in note/howpublished
+    VENUE_INDICATOR_PATTERN = re.compile(
+        "|".join(
+            re.escape(ind)
+            for ind in [
+                "submitted to",
+                "presented at",
+                "conference",
+                "workshop",
+                "symposium",
+                "proceedings",
+            ]
+        ),
+        re.IGNORECASE,
+    )
+
+    # API host -> key in self.limiters, for throttling a host that answers 429
+    LIMITER_HOSTS = {
+        "api.crossref.org": "crossref",
+        "export.arxiv.org": "arxiv",
+        "api.semanticscholar.org": "s2",
+        "dblp.org": "dblp",
+        "eutils.ncbi.nlm.nih.gov": "pubmed",
+        "zenodo.org": "zenodo",
+        "api.datacite.org": "datacite",
+        "api.openalex.org": "openalex",
+    }
+    # Pause after a 429 that does not say how long to wait (seconds)
+    DEFAULT_RETRY_AFTER = 5.0
+
+    # Threads fetching from the APIs; the HTTP connection pool is sized to
+    # match so no fetch thread waits for (or discards) a connection
+    FETCH_WORKERS = 32
+
+    # DOIs per Crossref filter query (keeps the URL well under length limits)
+    CROSSREF_BATCH_SIZE = 20
+    # DOIs per OpenAlex filter query (OpenAlex caps OR-filters at 50 values)
+    OPENALEX_BATCH_SIZE = 50
+    # Work fields read by _openalex_metadata; OpenAlex leaves out the rest
+    # (notably the large abstract_inverted_index) when asked with select=
+    OPENALEX_SELECT = "doi,title,publication_year,authorships,primary_location,biblio"
+
+    # API work type -> BibTeX entry type, per source (unknown types are misc)
+    API_TYPE_MAPS = {
+        # https://api.crossref.org/types
+        "crossref": {
+            "journal-article": "article",
+            "proceedings-article": "inproceedings",
+            "book": "book",
+            "book-chapter": "incollection",  # or inbook
+            "dissertation": "phdthesis",
+            "monograph": "book",
+            "report": "techreport",
+            "reference-entry": "incollection",
+            "posted-content": "misc",  # Preprints
+        },
+        "openalex": {
+            "article": "article",
+            "book-chapter": "incollection",
+            "book": "book",
+            "dissertation": "phdthesis",
+            "preprint": "misc",
+            "report": "techreport",
+        },
+        # DBLP types: Article, InProceedings, Book, InCollection, PhdThesis,
+        # MastersThesis, Proceedings
+        "dblp": {
+            "article": "article",
+            "inproceedings": "inproceedings",
+            "book": "book",
+            "incollection": "incollection",
+            "phdthesis": "phdthesis",
+            "mastersthesis": "mastersthesis",
+            "proceedings": "proceedings",
+        },
+    }
+
+    # DOI prefixes registered with DataCite (Zenodo, arXiv, figshare)
+    DATACITE_DOI_PREFIXES = frozenset({"10.5281", "10.48550", "10.6084"})
+
+    # Compiled XPaths over an arXiv API feed (first entry only), used with lxml
+    _ARXIV_XPATHS = (
+        {
+            name: lxml_etree.XPath(f"atom:entry[1]{expr}", namespaces=ARXIV_NS)
+            for name, expr in {
+                "entry": "",
+                "title": "/atom:title/text()",
+                "authors": "/atom:author/atom:name/text()",
+                "published": "/atom:published/text()",
+                "id": "/atom:id/text()",
+                "categories": "/atom:category/@term",
+                "journal_ref": "/arxiv:journal_ref/text()",
+                "doi": "/arxiv:doi/text()",
+            }.items()
+        }
+        if HAS_LXML
+        else {}
+    )
+
+    # Paths below a PubMed efetch article, and their compiled lxml forms
+    PUBMED_PATHS = {
+        "title": ".//ArticleTitle",
+        "authors": ".//Author",
+        "year": ".//PubDate/Year",
+        "journal": ".//Journal/Title",
+    }
+    _PUBMED_XPATHS = (
+        {
+            "article": lxml_etree.XPath("(//PubmedArticle)[1]"),
+            **{name: lxml_etree.XPath(path) for name, path in PUBMED_PATHS.items()},
+        }
+        if HAS_LXML
+        else {}
+    )
 
     def __init__(
         self,
@@ -324,6 +757,8 @@ class BibTeXValidator:
         output_file: Optional[str] = None,
         update_bib: bool = False,
         delay: float = 1.0,
+        use_cache: bool = True,
+        mailto: Optional[str] = None,
     ):
         """
         Initialize validator
@@ -332,7 +767,13 @@ class BibTeXValidator:
             bib_file: Path to input BibTeX file
             output_file: Path to output BibTeX file (default: bib_file)
             update_bib: If True, update the BibTeX file with enriched data
-            delay: Delay between API requests (seconds)
+            delay: Minimum spacing between API requests (seconds) to each
+                source without a fixed budget (Crossref, arXiv and Semantic
+                Scholar have their own limits in self.limiters)
+            use_cache: If True, cache API responses in .refval-cache.sqlite
+                next to the BibTeX file
+            mailto: Contact e-mail sent to Crossref for its polite pool
+                (default: $CROSSREF_MAILTO)
         """
         # Check dependencies
         if not HAS_BIBTEXPARSER:
@@ -348,6 +789,7 @@ class BibTeXValidator:
         self.output_file = Path(output_file) if output_file else self.bib_file
         self.update_bib = update_bib
         self.delay = delay
+        self.mailto = mailto or os.environ.get("CROSSREF_MAILTO") or None
         self.results: List[ValidationResult] = []
         self.PREFERRED_FIELD_ORDER = [
             "entrytype",
@@ -367,9 +809,36 @@ class BibTeXValidator:
             "eprinttype",
             "abstract",
         ]
+        # Field -> position in PREFERRED_FIELD_ORDER, used as a sort key
+        self._field_order = {f: i for i, f in enumerate(self.PREFERRED_FIELD_ORDER)}
 
         self.print_lock = threading.Lock()
-        self.arxiv_lock = threading.Lock()  # Rate limiting lock for ArXiv
+        # Long-lived pool for per-source fetches, shared by all entries
+        self.fetch_executor = ThreadPoolExecutor(
+            max_workers=self.FETCH_WORKERS, thread_name_prefix="fetch"
+        )
+
+        # Per-host request budgets (requests per second, burst size)
+        # Sources without a published limit are spaced by --delay
+        default_rate = 1 / delay if delay > 0 else float("inf")
+        self.limiters = {
+            "crossref": RateLimiter(50, 50),
+            "arxiv": RateLimiter(1 / 3, 1),  # arXiv asks for 1 req / 3s
+            "s2": RateLimiter(1, 1),
+            "dblp": RateLimiter(default_rate),
+            "pubmed": RateLimiter(default_rate),
+            "zenodo": RateLimiter(default_rate),
+            "datacite": RateLimiter(10, 10),  # 3000 req / 5 min per IP
+            "openalex": RateLimiter(10, 10),  # OpenAlex allows 10 req / s
+            "scholar": RateLimiter(default_rate / 2),  # Longer delay for Scholar
+        }
+        self._fetch_state = threading.local()  # Per-thread transient failure flag
+        self._crossref_prefetch: Dict[str, Dict] = {}  # lowercased DOI -> work
+        self._openalex_prefetch: Dict[str, Dict] = {}  # lowercased DOI -> metadata
+        self._registrars: Dict[str, str] = {}  # DOI prefix -> registrar
+        self._registrar_locks: Dict[str, threading.Lock] = {}  # one per prefix
+        self._registrar_lock = threading.Lock()  # guards _registrar_locks
+        self._field_mappings: Dict[str, Dict] = {}  # source -> compare_fields table
 
         # Compile schema
         self._compile_schemas()
@@ -379,37 +848,126 @@ class BibTeXValidator:
             raise FileNotFoundError(f"BibTeX file not found: {self.bib_file}")
 
         with open(self.bib_file, "r", encoding="utf-8") as f:
-            parser = BibTexParser(common_strings=True)
-            self.db = bibtexparser.load(f, parser=parser)
-
-    def _compile_schemas(self):
-        """Compile JSON schema into usable sets and lists"""
-        self.ALLOWED_FIELDS = {}
-        self.REQUIRED_FIELDS = {}
-        self.REQUIRED_ANY_FIELDS = {}  # list of lists of fields (one from each list must exist)
-        self.STRONGLY_RECOMMENDED_FIELDS = {}
-
-        common_core = set(self.FIELD_SCHEMA["common"]["core"])
-        common_extended = set(self.FIELD_SCHEMA["common"]["extended"])
-        common_all = common_core.union(common_extended).union({"ID", "ENTRYTYPE"})
-        self.COMMON_FIELDS = common_all  # Expose common fields
-
-        # Compile Strongly Recommended
-        self.STRONGLY_RECOMMENDED_FIELDS = self.FIELD_SCHEMA.get(
-            "strongly_recommended", {}
+            self.db = bibtexparser.load(f, parser=self._new_parser())
+
+        # Shared HTTP session: keeps connections alive across requests
+        self.session = requests.Session()
+        user_agent = "reference-validator/1.0"
+        if self.mailto:
+            user_agent += f" (+mailto:{self.mailto})"
+        self.session.headers["User-Agent"] = user_agent
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=self.FETCH_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True,
+                # Hand the final 429/5xx back instead of raising, so that
+                # _throttle_host sees it
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.hooks["response"].append(self._throttle_host)
+
+        # Persistent API response cache
+        self.cache: Optional[DiskCache] = None
+        if use_cache:
+            try:
+                self.cache = DiskCache(self.bib_file.parent / ".refval-cache.sqlite")
+            except sqlite3.Error as e:
+                print(f"Warning: API cache disabled ({e})", file=sys.stderr)
+
+    def _throttle_host(self, response, *args, **kwargs):
+        """
+        Session response hook: pause a host's limiter when it answers 429
+
+        By the time a response gets here urllib3 has used up its retries, so
+        the host is still over its limit. Pausing the shared limiter holds
+        back every thread, not just the one that got the 429.
+        """
+        if response.status_code != 429:
+            return
+        limiter = self.limiters.get(
+            self.LIMITER_HOSTS.get(urlsplit(response.url).hostname or "", "")
+        )
+        if limiter is None:
+            return
+        retry_after = response.headers.get("Retry-After", "")
+        limiter.pause(
+            float(retry_after) if retry_after.isdigit() else self.DEFAULT_RETRY_AFTER
+        )
+
+    def _mark_transient_failure(self):
+        """Flag the current fetch as failed for a retryable reason (not cached)"""
+        self._fetch_state.transient = True
+
+    def _revalidation_headers(self) -> Dict[str, str]:
+        """If-None-Match header when the current fetch revalidates a cached value"""
+        etag = getattr(self._fetch_state, "etag", None)
+        return {"If-None-Match": etag} if etag else {}
+
+    def _remember_etag(self, response):
+        """Keep the response's ETag so the cached result can be revalidated"""
+        self._fetch_state.response_etag = response.headers.get("ETag")
+
+    def _not_modified(self) -> Optional[Dict]:
+        """Answer a 304 with the cached value that was being revalidated"""
+        self._fetch_state.not_modified = True
+        return self._fetch_state.stale
+
+    @staticmethod
+    def _new_parser() -> "BibTexParser":
+        """Build a BibTeX parser with only the processing this tool relies on.
+
+        A parser accumulates every entry it has seen into its own database,
+        so each load gets a fresh instance rather than a shared one. Field
+        names are kept as written and no customization runs at parse time;
+        ``normalize_entry`` handles aliases later. Non-standard entry types
+        such as ``@online`` are kept so they can be mapped by
+        ``normalize_entry`` instead of being dropped by the parser.
+        """
+        parser = BibTexParser(common_strings=True)
+        parser.homogenize_fields = False
+        parser.customization = None
+        parser.ignore_nonstandard_types = False
+        return parser
+
+    @classmethod
+    def _compile_schemas(cls):
+        """
+        Compile JSON schema into usable sets and lists
+
+        The schema is static class data, so this runs once per class and the
+        results are shared by every validator instance.
+        """
+        if cls.__dict__.get("_SCHEMA_COMPILED"):
+            return
+
+        allowed_fields = {}
+        required_fields = {}
+        required_any_fields = {}  # list of lists of fields (one from each list must exist)
+
+        common_core = set(cls.FIELD_SCHEMA["common"]["core"])
+        common_extended = set(cls.FIELD_SCHEMA["common"]["extended"])
+        common_all = frozenset(
+            common_core.union(common_extended).union({"ID", "ENTRYTYPE"})
         )
 
-        for type_name, schema in self.FIELD_SCHEMA["types"].items():
+        for type_name, schema in cls.FIELD_SCHEMA["types"].items():
             # REQUIRED
-            self.REQUIRED_FIELDS[type_name] = schema.get("required", [])
+            required_fields[type_name] = tuple(schema.get("required", []))
 
             # REQUIRED ANY
             req_any = []
             if "required_any" in schema:
-                req_any.append(schema["required_any"])
+                req_any.append(tuple(schema["required_any"]))
             if "required_any_2" in schema:
-                req_any.append(schema["required_any_2"])
-            self.REQUIRED_ANY_FIELDS[type_name] = req_any
+                req_any.append(tuple(schema["required_any_2"]))
+            required_any_fields[type_name] = tuple(req_any)
 
             # ALLOWED
             allowed = set(schema.get("required", []))
@@ -427,7 +985,26 @@ class BibTeXValidator:
             # Add common
             allowed.update(common_all)
 
-            self.ALLOWED_FIELDS[type_name] = allowed
+            allowed_fields[type_name] = frozenset(allowed)
+
+        cls.ALLOWED_FIELDS = allowed_fields
+        cls.REQUIRED_FIELDS = required_fields
+        cls.REQUIRED_ANY_FIELDS = required_any_fields
+        cls.STRONGLY_RECOMMENDED_FIELDS = {
+            type_name: tuple(fields)
+            for type_name, fields in cls.FIELD_SCHEMA.get(
+                "strongly_recommended", {}
+            ).items()
+        }
+        cls.COMMON_FIELDS = common_all  # Expose common fields
+        # Lowercased names filter_entry_fields keeps per type (plus ID/ENTRYTYPE)
+        cls.KEPT_FIELDS_LOWER = {
+            type_name: frozenset(
+                k.lower() for k in fields.union(common_all, {"ID", "ENTRYTYPE"})
+            )
+            for type_name, fields in allowed_fields.items()
+        }
+        cls._SCHEMA_COMPILED = True
 
     def normalize_entry(self, entry: BibEntry) -> BibEntry:
         """
@@ -454,7 +1031,7 @@ class BibTeXValidator:
                     val = new_fields.pop(biblatex)
                     if biblatex == "date" and val:
                         # Extract YYYY
-                        match = re.search(r"\d{4}", val)
+                        match = self.YEAR_PATTERN.search(val)
                         if match:
                             new_fields[bibtex] = match.group(0)
                     else:
@@ -469,22 +1046,16 @@ class BibTeXValidator:
             "online": "misc",
             "report": "techreport",
         }
-        entry_type = type_aliases.get(
-            entry.entry_type.lower(), entry.entry_type.lower()
-        )
+        entry_type = entry.entry_type.lower()
+        entry_type = type_aliases.get(entry_type, entry_type)
 
         # 3. DOI & URL Normalization
         doi = new_fields.get("doi", "").strip()
         url = new_fields.get("url", "").strip()
 
-        # Navbar pattern for DOI in URL
-        doi_url_pattern = re.compile(
-            r"https?://(?:dx\.)?doi\.org/(10\..+)", re.IGNORECASE
-        )
-
         # If no DOI but URL is a DOI link, extract specific DOI
         if not doi and url:
-            match = doi_url_pattern.search(url)
+            match = self.DOI_URL_PATTERN.search(url)
             if match:
                 doi = match.group(1)
                 new_fields["doi"] = doi
@@ -494,22 +1065,14 @@ class BibTeXValidator:
 
         # Normalize DOI string (remove prefix, trailing punctuation)
         if doi:
-            # Remove https://doi.org/ or doi: prefixes if present in the field value itself
-            clean_doi = doi
-            if clean_doi.lower().startswith("https://doi.org/"):
-                clean_doi = clean_doi[16:]
-            elif clean_doi.lower().startswith("http://doi.org/"):
-                clean_doi = clean_doi[15:]
-            elif clean_doi.lower().startswith("doi:"):
-                clean_doi = clean_doi[4:]
-
-            clean_doi = clean_doi.strip().rstrip(".,")
+            # Remove doi.org URL or doi: prefixes if present in the field value itself
+            clean_doi = self.DOI_STRIP_PATTERN.sub("", doi).strip().rstrip(".,")
             new_fields["doi"] = clean_doi
             doi = clean_doi
 
         # Remove URL if it is just a link to the DOI (redundant)
         if doi and url:
-            match = doi_url_pattern.search(url)
+            match = self.DOI_URL_PATTERN.search(url)
             if match and match.group(1) == doi:
                 new_fields.pop("url")
 
@@ -547,13 +1110,14 @@ class BibTeXValidator:
 
         return BibEntry(entry_type=entry_type, citekey=entry.citekey, fields=new_fields)
 
-    def normalize_doi(self, doi: str) -> str:
-        """Normalize DOI format"""
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def normalize_doi(cls, doi: str) -> str:
+        """Normalize DOI format (memoized: the same DOIs recur across code paths)"""
         if not doi:
             return ""
-        doi = doi.strip()
-        # Remove 'doi:' prefix if present
-        doi = re.sub(r"^doi:\s*", "", doi, flags=re.IGNORECASE)
+        # Remove doi.org URL or 'doi:' prefix if present
+        doi = cls.DOI_STRIP_PATTERN.sub("", doi).strip()
         return doi
 
     def validate_entry_schema(self, entry: BibEntry) -> List[LintMessage]:
@@ -564,24 +1128,28 @@ class BibTeXValidator:
         fields = entry.fields
         entry_type = entry.entry_type
 
+        # Fields with a non-blank value; every check below is a set lookup
+        present = {k for k, v in fields.items() if v and not v.isspace()}
+
         # 1. Required Fields
-        required = self.REQUIRED_FIELDS.get(entry_type, [])
-        for req_field in required:
-            if not fields.get(req_field, "").strip():
-                messages.append(
-                    LintMessage(
-                        level="error",
-                        code="missing_required",
-                        message=f"Missing required field: {req_field}",
-                        field=req_field,
+        required = self.REQUIRED_FIELDS.get(entry_type, ())
+        if not present.issuperset(required):
+            for req_field in required:
+                if req_field not in present:
+                    messages.append(
+                        LintMessage(
+                            level="error",
+                            code="missing_required",
+                            message=f"Missing required field: {req_field}",
+                            field=req_field,
+                        )
                     )
-                )
 
         # 2. Required Any Fields
-        req_any = self.REQUIRED_ANY_FIELDS.get(entry_type, [])
+        req_any = self.REQUIRED_ANY_FIELDS.get(entry_type, ())
         for group in req_any:
             # Check if at least one field in the group exists
-            if not any(fields.get(f, "").strip() for f in group):
+            if present.isdisjoint(group):
                 messages.append(
                     LintMessage(
                         level="error",
@@ -591,24 +1159,25 @@ class BibTeXValidator:
                 )
 
         # 3. Strongly Recommended Fields
-        recommended = self.STRONGLY_RECOMMENDED_FIELDS.get(entry_type, [])
-        for rec_field in recommended:
-            if not fields.get(rec_field, "").strip():
-                messages.append(
-                    LintMessage(
-                        level="warning",
-                        code="missing_recommended",
-                        message=f"Missing recommended field: {rec_field}",
-                        field=rec_field,
+        recommended = self.STRONGLY_RECOMMENDED_FIELDS.get(entry_type, ())
+        if not present.issuperset(recommended):
+            for rec_field in recommended:
+                if rec_field not in present:
+                    messages.append(
+                        LintMessage(
+                            level="warning",
+                            code="missing_recommended",
+                            message=f"Missing recommended field: {rec_field}",
+                            field=rec_field,
+                        )
                     )
-                )
 
         # 4. Conditional Warnings
 
         # InContext (inbook/incollection) validation
         if entry_type in ["inbook", "incollection"]:
-            has_pages = bool(fields.get("pages", "").strip())
-            has_chapter = bool(fields.get("chapter", "").strip())
+            has_pages = "pages" in present
+            has_chapter = "chapter" in present
             if not has_pages and not has_chapter:
                 messages.append(
                     LintMessage(
@@ -620,8 +1189,8 @@ class BibTeXValidator:
 
         # Article validation
         if entry_type == "article":
-            has_vol = bool(fields.get("volume", "").strip())
-            has_pages = bool(fields.get("pages", "").strip())
+            has_vol = "volume" in present
+            has_pages = "pages" in present
             if not has_vol and not has_pages:
                 messages.append(
                     LintMessage(
@@ -644,18 +1213,10 @@ class BibTeXValidator:
         # If booktitle is missing, but venue info seems present in note/howpublished
         if "booktitle" not in fields and entry_type in ["inproceedings", "proceedings"]:
             # Check note or howpublished for venue keywords
-            venue_indicators = [
-                "submitted to",
-                "presented at",
-                "conference",
-                "workshop",
-                "symposium",
-                "proceedings",
-            ]
             potential_venue = (
                 fields.get("note", "") + " " + fields.get("howpublished", "")
             )
-            if any(ind in potential_venue.lower() for ind in venue_indicators):
+            if self.VENUE_INDICATOR_PATTERN.search(potential_venue):
                 messages.append(
                     LintMessage(
                         level="warning",
@@ -678,32 +1239,42 @@ class BibTeXValidator:
         Returns:
             Normalized arXiv ID (YYYY.NNNNN format, version suffix removed) or None
         """
+        return self._extract_arxiv_id(
+            entry.get("note", ""), entry.get("doi", ""), entry.get("eprint", "")
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_arxiv_id(cls, note: str, doi: str, eprint: str) -> Optional[str]:
+        """Memoized core of extract_arxiv_id, keyed on the three source fields"""
         # Check note field
-        note = entry.get("note", "")
         if note:
-            match = self.ARXIV_NOTE_PATTERN.search(note)
+            match = cls.ARXIV_NOTE_PATTERN.search(note)
             if match:
                 arxiv_id = match.group(1)
                 # Remove version suffix for API query
-                return re.sub(r"v\d+$", "", arxiv_id)
+                return cls.ARXIV_VERSION_PATTERN.sub("", arxiv_id)
 
         # Check doi field for arXiv DOI
-        doi = entry.get("doi", "")
         if doi:
-            match = self.ARXIV_DOI_PATTERN.search(doi)
+            match = cls.ARXIV_DOI_PATTERN.search(doi)
             if match:
                 return match.group(1)
 
         # Check eprint field
-        eprint = entry.get("eprint", "")
         if eprint:
             # Format: YYYY.NNNNN or YYYY.NNNNNvN
-            match = re.match(r"(\d{4}\.\d{4,5})(?:v\d+)?", eprint)
+            match = cls.ARXIV_EPRINT_PATTERN.match(eprint)
             if match:
                 return match.group(1)
 
         return None
 
+    def _crossref_params(self) -> Dict[str, str]:
+        """Query parameters that put Crossref requests in the polite pool"""
+        return {"mailto": self.mailto} if self.mailto else {}
+
+    @cached("crossref")
     def fetch_crossref_data(self, doi: str) -> Optional[Dict]:
         """
         Fetch metadata from Crossref API
@@ -715,114 +1286,339 @@ class BibTeXValidator:
             Dictionary with metadata or None if not found
         """
         doi = self.normalize_doi(doi)
-        url = f"https://api.crossref.org/works/{doi}"
+        prefetched = self._crossref_prefetch.get(doi.lower())
+        if prefetched is not None:
+            return prefetched
+        url = f"https://api.crossref.org/works/{quote(doi)}"
 
         try:
-            time.sleep(self.delay)  # Rate limiting
-            response = requests.get(
+            self.limiters["crossref"].acquire()
+            response = self.session.get(
                 url,
-                headers={
-                    "User-Agent": "BibTeX Validator (mailto:your.email@example.com)"
-                },
+                params=self._crossref_params(),
+                headers=self._revalidation_headers(),
                 timeout=10,
             )
 
+            if response.status_code == 304:
+                return self._not_modified()
             if response.status_code == 200:
-                data = response.json()
+                self._remember_etag(response)
+                data = json_loads(response.content)
                 return data.get("message", {})
             elif response.status_code == 404:
                 return None
             else:
+                self._mark_transient_failure()
                 return None
-        except requests.RequestException:
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
             return None
 
+    @cached("crossref_prefix")
+    def fetch_crossref_prefix(self, prefix: str) -> Optional[Dict]:
+        """
+        Fetch Crossref's record of a DOI prefix
+
+        Args:
+            prefix: DOI prefix such as "10.1038"
+
+        Returns:
+            Dictionary with the prefix owner, or None if Crossref does not
+            register DOIs under this prefix
+        """
+        url = f"https://api.crossref.org/prefixes/{quote(prefix)}"
+
+        try:
+            self.limiters["crossref"].acquire()
+            response = self.session.get(url, params=self._crossref_params(), timeout=10)
+
+            if response.status_code == 200:
+                return json_loads(response.content).get("message", {})
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
+
+        return None
+
+    def doi_registrar(self, doi: str) -> Optional[str]:
+        """
+        Work out which registration agency a DOI belongs to
+
+        Known DataCite prefixes are answered locally. Other prefixes are looked
+        up once with Crossref and remembered for the run (and in the disk
+        cache), so this costs at most one request per prefix rather than per
+        DOI. Concurrent lookups of the same prefix wait for the first one.
+
+        Returns:
+            "crossref", "datacite", "other" (a prefix Crossref does not know),
+            or None if the lookup failed
+        """
+        prefix = doi.split("/", 1)[0]
+        if prefix in self.DATACITE_DOI_PREFIXES:
+            return "datacite"
+
+        registrar = self._registrars.get(prefix)
+        if registrar is not None:
+            return registrar
+
+        with self._registrar_lock:
+            prefix_lock = self._registrar_locks.setdefault(prefix, threading.Lock())
+        with prefix_lock:
+            registrar = self._registrars.get(prefix)
+            if registrar is not None:
+                return registrar
+
+            self._fetch_state.transient = False
+            if self.fetch_crossref_prefix(prefix) is not None:
+                registrar = "crossref"
+            elif self._fetch_state.transient:
+                # Not remembered, so a later entry retries the lookup
+                return None
+            else:
+                registrar = "other"
+            self._registrars[prefix] = registrar
+        return registrar
+
+    def fetch_crossref_batch(self, dois: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch Crossref metadata for many DOIs with filter=doi:... queries
+
+        Results are kept for fetch_crossref_data, which then answers from memory
+        instead of issuing one request per DOI. DOIs that are already cached,
+        or that Crossref does not return, are left to the single-DOI lookup.
+        Known DataCite DOIs are skipped.
+
+        Args:
+            dois: DOI strings
+
+        Returns:
+            Dictionary mapping lowercased DOI to metadata
+        """
+        pending = []
+        seen = set()
+        for doi in dois:
+            doi = self.normalize_doi(doi)
+            # Commas separate filter clauses, so such DOIs cannot be batched
+            if not doi or "," in doi or doi.lower() in seen:
+                continue
+            seen.add(doi.lower())
+            # DataCite DOIs are never looked up on Crossref, so they would
+            # never be cached and would be batched again on every run
+            if doi.split("/", 1)[0] in self.DATACITE_DOI_PREFIXES:
+                continue
+            if self.cache is not None:
+                hit, _ = self.cache.get(_cache_key("crossref", (doi,), {}))
+                if hit:
+                    continue
+            pending.append(doi)
+
+        found = {}
+        url = "https://api.crossref.org/works"
+        for start in range(0, len(pending), self.CROSSREF_BATCH_SIZE):
+            chunk = pending[start : start + self.CROSSREF_BATCH_SIZE]
+            params = {
+                "filter": ",".join(f"doi:{doi}" for doi in chunk),
+                "rows": len(chunk),
+                **self._crossref_params(),
+            }
+            try:
+                self.limiters["crossref"].acquire()
+                response = self.session.get(url, params=params, timeout=30)
+                if response.status_code != 200:
+                    continue
+                items = json_loads(response.content).get("message", {}).get("items", [])
+            except (requests.RequestException, ValueError):
+                continue
+            for item in items:
+                if item.get("DOI"):
+                    found[item["DOI"].lower()] = item
+
+        self._crossref_prefetch.update(found)
+        return found
+
+    @cached("arxiv")
     def fetch_arxiv_data(self, arxiv_id: str) -> Optional[Dict]:
         """
         Fetch metadata from arXiv API
         Respects strict rate limiting: 1 req / 3s
         """
-        url = f"http://export.arxiv.org/api/query?id_list={arxiv_id}"
+        url = f"https://export.arxiv.org/api/query?id_list={arxiv_id}"
 
         try:
-            with self.arxiv_lock:
-                time.sleep(5.0)  # ArXiv strict rate limiting
-                response = requests.get(url, timeout=10)
+            self.limiters["arxiv"].acquire()
+            response = self.session.get(url, timeout=10, stream=True)
 
             if response.status_code == 200:
-                # Parse XML response
-                root = ET.fromstring(response.content)
-
-                # Check for entries
-                entries = root.findall("{http://www.w3.org/2005/Atom}entry")
-                if not entries:
+                content = self._read_arxiv_feed(response)
+                if content is None:
                     return None
-
-                entry = entries[0]  # Take first entry
+                fields = self._parse_arxiv_feed(content)
+                if fields is None:
+                    return None
+                title, authors, published, id_text, categories, journal_ref, doi = (
+                    fields
+                )
 
                 # Extract metadata
                 metadata = {}
 
                 # Title
-                title_elem = entry.find("{http://www.w3.org/2005/Atom}title")
-                if title_elem is not None and title_elem.text:
+                if title:
                     # Remove newlines and extra spaces
-                    metadata["title"] = " ".join(title_elem.text.split())
+                    metadata["title"] = " ".join(title.split())
 
                 # Authors
-                authors = []
-                for author in entry.findall("{http://www.w3.org/2005/Atom}author"):
-                    name_elem = author.find("{http://www.w3.org/2005/Atom}name")
-                    if name_elem is not None and name_elem.text:
-                        authors.append(name_elem.text)
                 if authors:
                     metadata["authors"] = authors
 
                 # Published date
-                published_elem = entry.find("{http://www.w3.org/2005/Atom}published")
-                if published_elem is not None and published_elem.text:
+                if published:
                     # Format: YYYY-MM-DDTHH:MM:SSZ
-                    year_match = re.match(r"(\d{4})", published_elem.text)
+                    year_match = self.YEAR_PATTERN.match(published)
                     if year_match:
-                        metadata["year"] = year_match.group(1)
+                        metadata["year"] = year_match.group(0)
 
                 # ID (arXiv URL)
-                id_elem = entry.find("{http://www.w3.org/2005/Atom}id")
-                if id_elem is not None and id_elem.text:
+                if id_text:
                     # Extract arXiv ID from URL
-                    id_match = re.search(
-                        r"arxiv\.org/abs/(\d{4}\.\d{4,5})", id_elem.text
-                    )
+                    id_match = self.ARXIV_ABS_PATTERN.search(id_text)
                     if id_match:
                         metadata["arxiv_id"] = id_match.group(1)
 
                 # Categories (optional)
-                categories = []
-                for category in entry.findall("{http://www.w3.org/2005/Atom}category"):
-                    term = category.get("term")
-                    if term:
-                        categories.append(term)
                 if categories:
                     metadata["categories"] = categories
 
                 # arXiv specific metadata (journal ref, doi)
-                # Namespace: http://arxiv.org/schemas/atom
-                arxiv_ns = "{http://arxiv.org/schemas/atom}"
-
-                journal_ref_elem = entry.find(f"{arxiv_ns}journal_ref")
-                if journal_ref_elem is not None and journal_ref_elem.text:
-                    metadata["journal"] = journal_ref_elem.text
+                if journal_ref:
+                    metadata["journal"] = journal_ref
 
-                doi_elem = entry.find(f"{arxiv_ns}doi")
-                if doi_elem is not None and doi_elem.text:
-                    metadata["doi"] = doi_elem.text
+                if doi:
+                    metadata["doi"] = doi
 
                 return metadata if metadata else None
             else:
+                response.close()
+                self._mark_transient_failure()
+                return None
+        except (requests.RequestException,) + XML_PARSE_ERRORS:
+            self._mark_transient_failure()
+            return None
+
+    def _read_arxiv_feed(self, response) -> Optional[bytes]:
+        """
+        Read a streamed arXiv API response
+
+        A query without results returns a short feed with no <entry>. If the
+        whole feed arrives in the first chunk and has no entry, the response
+        is closed and None is returned without reading or parsing further.
+        """
+        chunks = response.iter_content(chunk_size=4096)
+        head = next(chunks, b"")
+        if b"</feed>" in head and b"<entry" not in head:
+            response.close()
+            return None
+        return head + b"".join(chunks)
+
+    def _parse_arxiv_feed(self, content: bytes) -> Optional[Tuple]:
+        """
+        Pull the raw fields of the first entry out of an arXiv Atom feed
+
+        The feed is small and regular, so it is first scanned as text. Only if
+        that misses something is it parsed as XML, with the precompiled lxml
+        XPaths when lxml is installed and ElementTree otherwise.
+
+        Returns:
+            (title, authors, published, id, categories, journal_ref, doi),
+            or None if the feed has no entry
+        """
+        fields = self._scan_arxiv_feed(content)
+        if fields is not None:
+            return fields
+
+        if HAS_LXML:
+            root = lxml_etree.fromstring(content)
+            xpaths = self._ARXIV_XPATHS
+            if not xpaths["entry"](root):
                 return None
-        except (requests.RequestException, ET.ParseError):  # Removed unused 'e'
+
+            def first(name):
+                values = xpaths[name](root)
+                return str(values[0]) if values else None
+
+            return (
+                first("title"),
+                [str(name) for name in xpaths["authors"](root)],
+                first("published"),
+                first("id"),
+                [str(term) for term in xpaths["categories"](root) if term],
+                first("journal_ref"),
+                first("doi"),
+            )
+
+        root = ET.fromstring(content)
+        entry = root.find("atom:entry", ARXIV_NS)
+        if entry is None:
             return None
+        authors = [
+            author.findtext("atom:name", None, ARXIV_NS)
+            for author in entry.findall("atom:author", ARXIV_NS)
+        ]
+        categories = [
+            category.get("term")
+            for category in entry.findall("atom:category", ARXIV_NS)
+        ]
+        return (
+            entry.findtext("atom:title", None, ARXIV_NS),
+            [name for name in authors if name],
+            entry.findtext("atom:published", None, ARXIV_NS),
+            entry.findtext("atom:id", None, ARXIV_NS),
+            [term for term in categories if term],
+            entry.findtext("arxiv:journal_ref", None, ARXIV_NS),
+            entry.findtext("arxiv:doi", None, ARXIV_NS),
+        )
+
+    def _scan_arxiv_feed(self, content: bytes) -> Optional[Tuple]:
+        """
+        Regex fast path for _parse_arxiv_feed
+
+        Returns the same tuple, or None if the entry cannot be read reliably
+        as text (no plain <entry>, no title/id, or an element that is present
+        but not in the simple form the patterns expect).
+        """
+        text = content.decode("utf-8", "replace")
+        start = text.find("<entry>")
+        end = text.find("</entry>", start)
+        if start == -1 or end == -1:
+            return None
+        entry = text[start:end]
+
+        found = {
+            name: [html.unescape(value) for value in pattern.findall(entry)]
+            for name, pattern in self.ARXIV_FEED_PATTERNS.items()
+        }
+        if not found["title"] or not found["id"]:
+            return None
+        for name, tag in self.ARXIV_FEED_TAGS.items():
+            if entry.count(tag) != len(found[name]):
+                return None
+
+        def first(name):
+            return found[name][0] if found[name] else None
+
+        return (
+            first("title"),
+            found["authors"],
+            first("published"),
+            first("id"),
+            found["categories"],
+            first("journal_ref"),
+            first("doi"),
+        )
 
+    @cached("semantic_scholar")
     def fetch_semantic_scholar_data(
         self, title: str, author: Optional[str] = None
     ) -> Optional[Dict]:
@@ -844,11 +1640,11 @@ class BibTeXValidator:
         }
 
         try:
-            time.sleep(self.delay)
-            response = requests.get(url, params=params, timeout=10)
+            self.limiters["s2"].acquire()
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 papers = data.get("data", [])
                 if papers:
                     paper = papers[0]
@@ -876,11 +1672,14 @@ class BibTeXValidator:
                         metadata["doi"] = paper["doi"]
 
                     return metadata if metadata else None
-        except requests.RequestException:
-            pass
+            else:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
 
         return None
 
+    @cached("dblp")
     def fetch_dblp_data(
         self, title: str, author: Optional[str] = None
     ) -> Optional[Dict]:
@@ -899,15 +1698,16 @@ class BibTeXValidator:
         params = {
             "q": f"{title} {author}" if author else title,
             "h": 1,
+            "c": 0,  # No term completions block, only the hit we read
             "format": "json",
         }
 
         try:
-            time.sleep(self.delay)
-            response = requests.get(url, params=params, timeout=10)
+            self.limiters["dblp"].acquire()
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 hits = data.get("result", {}).get("hits", {}).get("hit", [])
                 if hits:
                     hit = hits[0]
@@ -936,11 +1736,14 @@ class BibTeXValidator:
                         metadata["journal"] = info["venue"]
 
                     return metadata if metadata else None
-        except requests.RequestException:
-            pass
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
 
         return None
 
+    @cached("pubmed")
     def fetch_pubmed_data(self, pmid: str) -> Optional[Dict]:
         """
         Fetch metadata from PubMed API via Entrez
@@ -955,51 +1758,78 @@ class BibTeXValidator:
         params = {"db": "pubmed", "id": pmid, "retmode": "xml"}
 
         try:
-            time.sleep(self.delay)
-            response = requests.get(url, params=params, timeout=10)
+            self.limiters["pubmed"].acquire()
+            response = self.session.get(url, params=params, timeout=10)
 
             if response.status_code == 200:
-                root = ET.fromstring(response.content)
+                metadata = self._parse_pubmed_article(response.content)
+                return metadata if metadata else None
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException,) + XML_PARSE_ERRORS:
+            self._mark_transient_failure()
 
-                # Parse PubMed XML
-                article = root.find(".//PubmedArticle")
-                if article is not None:
-                    metadata = {}
+        return None
 
-                    # Title
-                    title_elem = article.find(".//ArticleTitle")
-                    if title_elem is not None and title_elem.text:
-                        metadata["title"] = title_elem.text
-
-                    # Authors
-                    authors = []
-                    for author in article.findall(".//Author"):
-                        last = author.find("LastName")
-                        first = author.find("ForeName")
-                        if last is not None and last.text:
-                            name = last.text
-                            if first is not None and first.text:
-                                name = f"{last.text}, {first.text}"
-                            authors.append(name)
-                    if authors:
-                        metadata["authors"] = authors
-
-                    # Year
-                    year_elem = article.find(".//PubDate/Year")
-                    if year_elem is not None and year_elem.text:
-                        metadata["year"] = year_elem.text
-
-                    # Journal
-                    journal_elem = article.find(".//Journal/Title")
-                    if journal_elem is not None and journal_elem.text:
-                        metadata["journal"] = journal_elem.text
+    def _parse_pubmed_article(self, content: bytes) -> Optional[Dict]:
+        """
+        Pull title, authors, year and journal out of the first article of a
+        PubMed efetch response
 
-                    return metadata if metadata else None
-        except (requests.RequestException, ET.ParseError):
-            pass
+        Uses the precompiled lxml XPaths when lxml is installed and
+        ElementTree otherwise.
 
-        return None
+        Returns:
+            Dictionary with the fields found, or None if there is no article
+        """
+        if HAS_LXML:
+            xpaths = self._PUBMED_XPATHS
+            found = xpaths["article"](lxml_etree.fromstring(content))
+            if not found:
+                return None
+            article = found[0]
+
+            def find_all(name):
+                return xpaths[name](article)
+
+        else:
+            article = ET.fromstring(content).find(".//PubmedArticle")
+            if article is None:
+                return None
+
+            def find_all(name):
+                return article.findall(self.PUBMED_PATHS[name])
+
+        def first_text(name):
+            found = find_all(name)
+            return found[0].text if found else None
 
+        metadata = {}
+
+        title = first_text("title")
+        if title:
+            metadata["title"] = title
+
+        authors = []
+        for author in find_all("authors"):
+            last = author.findtext("LastName")
+            first = author.findtext("ForeName")
+            if last:
+                authors.append(f"{last}, {first}" if first else last)
+        if authors:
+            metadata["authors"] = authors
+
+        year = first_text("year")
+        if year:
+            metadata["year"] = year
+
+        journal = first_text("journal")
+        if journal:
+            metadata["journal"] = journal
+
+        return metadata
+
+    @cached("zenodo")
     def fetch_zenodo_data(self, doi: str) -> Optional[Dict]:
         """
         Fetch metadata from Zenodo API
@@ -1015,7 +1845,7 @@ class BibTeXValidator:
             return None
 
         # Extract record ID from Zenodo DOI (e.g., 10.5281/zenodo.1234567 -> 1234567)
-        match = re.search(r"zenodo\.(\d+)", doi)
+        match = self.ZENODO_RECORD_PATTERN.search(doi)
         if not match:
             return None
 
@@ -1023,11 +1853,11 @@ class BibTeXValidator:
         url = f"https://zenodo.org/api/records/{record_id}"
 
         try:
-            time.sleep(self.delay)
-            response = requests.get(url, timeout=10)
+            self.limiters["zenodo"].acquire()
+            response = self.session.get(url, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 metadata = data.get("metadata", {})
                 if not metadata:
                     return None
@@ -1080,11 +1910,14 @@ class BibTeXValidator:
                     result["url"] = f"https://doi.org/{metadata['doi']}"
 
                 return result
-        except requests.RequestException:
-            pass
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
 
         return None
 
+    @cached("datacite")
     def fetch_datacite_data(self, doi: str) -> Optional[Dict]:
         """
         Fetch metadata from DataCite API
@@ -1099,11 +1932,11 @@ class BibTeXValidator:
         url = f"https://api.datacite.org/dois/{doi}"
 
         try:
-            time.sleep(self.delay)
-            response = requests.get(url, timeout=10)
+            self.limiters["datacite"].acquire()
+            response = self.session.get(url, timeout=10)
 
             if response.status_code == 200:
-                data = response.json()
+                data = json_loads(response.content)
                 attributes = data.get("data", {}).get("attributes", {})
                 if not attributes:
                     return None
@@ -1151,11 +1984,14 @@ class BibTeXValidator:
                     metadata["url"] = attributes["url"]
 
                 return metadata if metadata else None
-        except requests.RequestException:
-            pass
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
 
         return None
 
+    @cached("openalex")
     def fetch_openalex_data(
         self, doi: Optional[str] = None, title: Optional[str] = None
     ) -> Optional[Dict]:
@@ -1175,28 +2011,41 @@ class BibTeXValidator:
         if doi:
             # Normalize DOI
             doi = self.normalize_doi(doi)
+            prefetched = self._openalex_prefetch.get(doi.lower())
+            if prefetched is not None:
+                return prefetched
             # Use specific DOI endpoint or filter
             target_url = f"{url}/doi:{doi}"
-            params = {}
+            params = {"select": self.OPENALEX_SELECT}
         elif title:
             # Search by title
             target_url = url
-            params = {"filter": f"title.search:{title}", "per-page": 1}
+            params = {
+                "filter": f"title.search:{title}",
+                "per-page": 1,
+                "select": self.OPENALEX_SELECT,
+            }
         else:
             return None
 
         try:
-            # Use a polite pool email if possible (recommended by OpenAlex)
-            # We'll use a generic one or the user's if configured, but for now just the request
-            headers = {"User-Agent": "BibTeX Validator (mailto:your.email@example.com)"}
-
-            time.sleep(self.delay)
-            response = requests.get(
-                target_url, params=params, headers=headers, timeout=10
+            # OpenAlex's polite pool is keyed on a mailto parameter
+            if self.mailto:
+                params["mailto"] = self.mailto
+
+            self.limiters["openalex"].acquire()
+            response = self.session.get(
+                target_url,
+                params=params,
+                headers=self._revalidation_headers(),
+                timeout=10,
             )
 
+            if response.status_code == 304:
+                return self._not_modified()
             if response.status_code == 200:
-                data = response.json()
+                self._remember_etag(response)
+                data = json_loads(response.content)
 
                 # If search by title, results are in 'results' list
                 result = None
@@ -1211,60 +2060,123 @@ class BibTeXValidator:
                 if not result:
                     return None
 
-                metadata = {}
+                return self._openalex_metadata(result)
+            elif response.status_code != 404:
+                self._mark_transient_failure()
+        except (requests.RequestException, ValueError):
+            self._mark_transient_failure()
 
-                # Title
-                if "title" in result:
-                    metadata["title"] = result["title"]
+        return None
 
-                # Authors
-                valid_authors = []
-                for authorship in result.get("authorships", []):
-                    author_obj = authorship.get("author", {})
-                    name = author_obj.get("display_name")
-                    if name:
-                        valid_authors.append(name)
-                if valid_authors:
-                    metadata["authors"] = valid_authors
+    def fetch_openalex_batch(self, dois: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch OpenAlex metadata for many DOIs with filter=doi:A|B|... queries
 
-                # Publication Year
-                if "publication_year" in result:
-                    metadata["year"] = str(result["publication_year"])
+        Results are kept for fetch_openalex_data, which then answers DOI
+        lookups from memory. DOIs that are already cached, or that OpenAlex
+        does not return, are left to the single-DOI lookup.
 
-                # Venue/Journal
-                loc = result.get("primary_location", {}) or {}
-                source = loc.get("source", {}) or {}
-                if source and "display_name" in source:
-                    metadata["journal"] = source["display_name"]
+        Args:
+            dois: DOI strings
 
-                # DOI
-                if "doi" in result:
-                    # OpenAlex returns DOI as URL (https://doi.org/...)
-                    doi_val = result["doi"]
-                    if doi_val:
-                        metadata["doi"] = doi_val.replace(
-                            "https://doi.org/", ""
-                        ).replace("http://doi.org/", "")
-
-                # Volume/Issue/Pages
-                biblio = result.get("biblio", {})
-                if biblio.get("volume"):
-                    metadata["volume"] = biblio["volume"]
-                if biblio.get("issue"):
-                    metadata["number"] = biblio["issue"]
-                if biblio.get("first_page"):
-                    end_page = biblio.get("last_page")
-                    if end_page:
-                        metadata["pages"] = f"{biblio['first_page']}--{end_page}"
-                    else:
-                        metadata["pages"] = biblio["first_page"]
+        Returns:
+            Dictionary mapping lowercased DOI to metadata
+        """
+        pending = []
+        seen = set()
+        for doi in dois:
+            doi = self.normalize_doi(doi)
+            # "|" separates alternatives and "," filters, so such DOIs cannot be batched
+            if not doi or "|" in doi or "," in doi or doi.lower() in seen:
+                continue
+            seen.add(doi.lower())
+            if self.cache is not None:
+                hit, _ = self.cache.get(_cache_key("openalex", (), {"doi": doi}))
+                if hit:
+                    continue
+            pending.append(doi)
 
-                return metadata if metadata else None
+        found = {}
+        url = "https://api.openalex.org/works"
+        for start in range(0, len(pending), self.OPENALEX_BATCH_SIZE):
+            chunk = pending[start : start + self.OPENALEX_BATCH_SIZE]
+            params = {
+                "filter": "doi:" + "|".join(chunk),
+                "per-page": len(chunk),
+                "select": self.OPENALEX_SELECT,
+            }
+            if self.mailto:
+                params["mailto"] = self.mailto
+            try:
+                self.limiters["openalex"].acquire()
+                response = self.session.get(url, params=params, timeout=30)
+                if response.status_code != 200:
+                    continue
+                results = json_loads(response.content).get("results", [])
+            except (requests.RequestException, ValueError):
+                continue
+            for result in results:
+                metadata = self._openalex_metadata(result)
+                if metadata and metadata.get("doi"):
+                    found[metadata["doi"].lower()] = metadata
 
-        except requests.RequestException:
-            pass
+        self._openalex_prefetch.update(found)
+        return found
 
-        return None
+    def _openalex_metadata(self, result: Dict) -> Optional[Dict]:
+        """
+        Convert an OpenAlex work object to metadata
+
+        Returns:
+            Dictionary with metadata, or None if the work has none of the fields
+        """
+        metadata = {}
+
+        # Title
+        if "title" in result:
+            metadata["title"] = result["title"]
+
+        # Authors
+        valid_authors = []
+        for authorship in result.get("authorships", []):
+            author_obj = authorship.get("author", {})
+            name = author_obj.get("display_name")
+            if name:
+                valid_authors.append(name)
+        if valid_authors:
+            metadata["authors"] = valid_authors
+
+        # Publication Year
+        if "publication_year" in result:
+            metadata["year"] = str(result["publication_year"])
+
+        # Venue/Journal
+        loc = result.get("primary_location", {}) or {}
+        source = loc.get("source", {}) or {}
+        if source and "display_name" in source:
+            metadata["journal"] = source["display_name"]
+
+        # DOI
+        if "doi" in result:
+            # OpenAlex returns DOI as URL (https://doi.org/...)
+            doi_val = result["doi"]
+            if doi_val:
+                metadata["doi"] = self.DOI_STRIP_PATTERN.sub("", doi_val)
+
+        # Volume/Issue/Pages
+        biblio = result.get("biblio", {})
+        if biblio.get("volume"):
+            metadata["volume"] = biblio["volume"]
+        if biblio.get("issue"):
+            metadata["number"] = biblio["issue"]
+        if biblio.get("first_page"):
+            end_page = biblio.get("last_page")
+            if end_page:
+                metadata["pages"] = f"{biblio['first_page']}--{end_page}"
+            else:
+                metadata["pages"] = biblio["first_page"]
+
+        return metadata if metadata else None
 
     def format_author_list(self, authors: List[str]) -> str:
         """Convert author list to BibTeX format"""
@@ -1304,9 +2216,13 @@ class BibTeXValidator:
 
     def extract_string_from_api_value(self, api_value) -> str:
         """Extract string from API value (handles list format)"""
+        # Plain strings are by far the most common case; skip str() for them
+        if type(api_value) is str:
+            return api_value.strip()
         if isinstance(api_value, list):
-            if len(api_value) > 0:
-                return str(api_value[0]).strip()
+            if api_value:
+                first = api_value[0]
+                return (first if type(first) is str else str(first)).strip()
             return ""
         return str(api_value).strip()
 
@@ -1326,10 +2242,6 @@ class BibTeXValidator:
         if not s:
             return ""
 
-        # Special handling for ENTRYTYPE
-        if field_name == "entrytype" or field_name == "ENTRYTYPE":
-            return s.lower().strip()
-
         # Handle list format (should be extracted before this, but safety check)
         if isinstance(s, list):
             if len(s) > 0:
@@ -1337,94 +2249,179 @@ class BibTeXValidator:
             else:
                 return ""
 
-        s = str(s)
-        # Remove LaTeX braces
-        s = re.sub(r"[{}]", "", s)
-        # Normalize LaTeX escaped characters
-        s = (
-            s.replace("\\&", "&")
-            .replace("\\%", "%")
-            .replace("\\$", "$")
-            .replace("\\#", "#")
+        return self._normalize_for_comparison(str(s), field_name)
+
+    @classmethod
+    @functools.lru_cache(maxsize=8192)
+    def _normalize_for_comparison(cls, s: str, field_name: str) -> str:
+        """Memoized core of normalize_string_for_comparison (values recur a lot)"""
+        # Special handling for ENTRYTYPE
+        if field_name == "entrytype" or field_name == "ENTRYTYPE":
+            return s.lower().strip()
+
+        # Remove LaTeX braces (and, for ISSNs, hyphens: 0378-7788 -> 03787788)
+        # in the same pass
+        s = s.translate(
+            cls.ISSN_STRIP_TABLE if field_name == "issn" else cls.LATEX_BRACE_TABLE
         )
+        # Normalize LaTeX escaped characters
+        # (most values contain neither a backslash nor an entity, so the
+        # replace chains are skipped after a single scan)
+        if "\\" in s:
+            s = (
+                s.replace("\\&", "&")
+                .replace("\\%", "%")
+                .replace("\\$", "$")
+                .replace("\\#", "#")
+            )
         # Decode HTML entities
-        s = (
-            s.replace("&amp;", "&")
-            .replace("&lt;", "<")
-            .replace("&gt;", ">")
-            .replace("&quot;", '"')
-        )
+        if "&" in s:
+            s = (
+                s.replace("&amp;", "&")
+                .replace("&lt;", "<")
+                .replace("&gt;", ">")
+                .replace("&quot;", '"')
+            )
         s = s.strip()
 
-        if field_name == "title":
-            s = s.lower()
-        elif field_name == "issn":
+        if field_name == "issn":
             # Handle multiple ISSNs: take first one
             if "," in s:
                 s = s.split(",")[0].strip()
-            # Remove hyphens: 0378-7788 -> 03787788
-            s = re.sub(r"-", "", s)
-            s = s.lower()
-        elif field_name == "doi":
-            # Normalize DOI to lowercase
             s = s.lower()
-        elif field_name == "author":
-            # Normalize common name prefixes (von, van, etc.)
-            # Just lowercase for comparison, as name order and formatting can vary
-            s = s.lower()
-        elif field_name == "journal":
-            # Just lowercase for comparison
+        elif field_name in cls.CASE_INSENSITIVE_FIELDS:
+            # Case and name formatting vary between sources, so compare lowercased
             s = s.lower()
 
-        return s
+        return s
+
+    def _field_mapping(self, source: str) -> Dict[str, Tuple]:
+        """
+        Map BibTeX fields to (API field, transformer) for a metadata source
+
+        The table depends only on the source, so it is built once per source
+        and reused by every compare_fields call instead of being rebuilt, with
+        all its closures, for every entry. Transformers are bound methods or
+        partials where no extra logic is needed.
+        """
+        mapping = self._field_mappings.get(source)
+        if mapping is not None:
+            return mapping
+
+        if source == "crossref":
+            mapping = {
+                "title": ("title", self.extract_string_from_api_value),
+                "author": ("author", self.format_crossref_author_list),
+                "journal": ("container-title", self.extract_string_from_api_value),
+                "year": ("published-print", self.format_date),
+                "volume": (
+                    "volume",
+                    lambda x: self.extract_string_from_api_value(x) if x else None,
+                ),
+                "pages": (
+                    "page",
+                    lambda x: self.extract_string_from_api_value(x) if x else None,
+                ),
+                "doi": (
+                    "DOI",
+                    lambda x: self.extract_string_from_api_value(x).lower()
+                    if x
+                    else None,
+                ),
+                "issn": (
+                    "ISSN",
+                    lambda x: self.extract_string_from_api_value(x) if x else None,
+                ),
+                "entrytype": (
+                    "type",
+                    functools.partial(self.map_api_type_to_bibtex, source="crossref"),
+                ),
+            }
+        else:
+            mapping = {
+                "title": (
+                    "title",
+                    lambda x: self.extract_string_from_api_value(x)
+                    if isinstance(x, str)
+                    else str(x)
+                    if x
+                    else None,
+                ),
+                "author": (
+                    "authors",
+                    lambda x: self.format_author_list(x)
+                    if isinstance(x, list)
+                    else str(x)
+                    if x
+                    else None,
+                ),
+                "journal": (
+                    "journal",
+                    lambda x: self.extract_string_from_api_value(x)
+                    if isinstance(x, str)
+                    else str(x)
+                    if x
+                    else None,
+                ),
+                "year": ("year", lambda x: str(x) if x else None),
+                "doi": ("doi", lambda x: str(x).lower() if x else None),
+                "publisher": ("publisher", lambda x: str(x).strip() if x else None),
+                "volume": ("volume", lambda x: str(x).strip() if x else None),
+                "number": ("number", lambda x: str(x).strip() if x else None),
+                "pages": ("pages", lambda x: str(x).strip() if x else None),
+                "entrytype": (
+                    "type",
+                    functools.partial(self.map_api_type_to_bibtex, source=source)
+                    if source in ["dblp", "openalex"]
+                    else lambda x: "misc",
+                ),
+            }
+
+        self._field_mappings[source] = mapping
+        return mapping
 
     def compare_fields(
-        self, bib_entry: Dict, api_data: Dict, source: str = "crossref"
+        self,
+        bib_entry: Dict,
+        api_data: Dict,
+        source: str = "crossref",
+        bib_cache: Optional[Dict[str, str]] = None,
     ) -> Dict:
         """
         Compare BibTeX entry with API data and identify conflicts/updates/identical/different
 
+        Args:
+            bib_entry: BibTeX entry
+            api_data: Metadata from one source
+            source: Source name
+            bib_cache: Comparison forms of the entry's fields, filled in
+                as they are computed. Pass the same dict when comparing one
+                entry against several sources so each field is normalized once.
+
         Returns:
-            Dictionary with 'updated', 'conflicts', 'identical', 'different', 'sources' keys
+            Dictionary with 'updated', 'conflicts', 'identical', 'different',
+            'sources' keys, plus 'normalized': the comparison form of each API
+            value that was normalized here, so callers need not redo it, and
+            'field_status': the same outcome as one FieldDiff per field
         """
         updates = {}
         conflicts = {}
         identical = {}
         different = {}
         sources = {}
+        normalized = {}
+        # Bound once: this is called per field, per source, per entry
+        normalize = self.normalize_string_for_comparison
+        if bib_cache is None:
+            bib_cache = {}
+
+        def normalize_bib(value: str, field_name: str) -> str:
+            if field_name not in bib_cache:
+                bib_cache[field_name] = normalize(value, field_name)
+            return bib_cache[field_name]
 
         if source == "crossref":
-            field_mapping = {
-                "title": ("title", lambda x: self.extract_string_from_api_value(x)),
-                "author": ("author", self.format_crossref_author_list),
-                "journal": (
-                    "container-title",
-                    lambda x: self.extract_string_from_api_value(x),
-                ),
-                "year": ("published-print", self.format_date),
-                "volume": (
-                    "volume",
-                    lambda x: self.extract_string_from_api_value(x) if x else None,
-                ),
-                "pages": (
-                    "page",
-                    lambda x: self.extract_string_from_api_value(x) if x else None,
-                ),
-                "doi": (
-                    "DOI",
-                    lambda x: self.extract_string_from_api_value(x).lower()
-                    if x
-                    else None,
-                ),
-                "issn": (
-                    "ISSN",
-                    lambda x: self.extract_string_from_api_value(x) if x else None,
-                ),
-                "entrytype": (
-                    "type",
-                    lambda x: self.map_api_type_to_bibtex(x, "crossref"),
-                ),
-            }
+            field_mapping = self._field_mapping(source)
 
             for bib_field, (api_field, transformer) in field_mapping.items():
                 api_value = api_data.get(api_field)
@@ -1460,28 +2457,25 @@ class BibTeXValidator:
                 bib_value = bib_entry.get(bib_field, "").strip()
                 api_value_str = str(api_value).strip()
 
-                # Normalize for comparison
-                bib_normalized = self.normalize_string_for_comparison(
-                    bib_value, bib_field
-                )
-                api_normalized = self.normalize_string_for_comparison(
-                    api_value_str, bib_field
-                )
-
                 # Track source for this field
                 sources[bib_field] = source
 
                 if not bib_value:
-                    # Missing field - suggest update
+                    # Missing field - suggest update (nothing to compare)
                     # Skip empty lists or empty strings
                     if api_value_str and api_value_str != "[]":
                         updates[bib_field] = api_value_str
-                elif bib_normalized == api_normalized:
+                    continue
+
+                # Normalize for comparison
+                bib_normalized = normalize_bib(bib_value, bib_field)
+                api_normalized = normalize(api_value_str, bib_field)
+                normalized[bib_field] = api_normalized
+
+                if bib_normalized == api_normalized:
                     # Identical field
                     identical[bib_field] = bib_value
-                elif bib_normalized != api_normalized and bib_field not in [
-                    "pages"
-                ]:  # Pages format can vary
+                elif bib_field not in ["pages"]:  # Pages format can vary
                     # Check if it's a significant conflict
                     if len(bib_value) > 3 and len(api_value_str) > 3:
                         # For author and title (case differences), prefer API value (update instead of conflict)
@@ -1506,8 +2500,9 @@ class BibTeXValidator:
 
             api_type = "inproceedings" if is_published else "misc"
             sources["entrytype"] = source
+            normalized["entrytype"] = api_type  # Already lowercase and stripped
 
-            if self.normalize_string_for_comparison(bib_type, "entrytype") != api_type:
+            if normalize_bib(bib_type, "ENTRYTYPE") != api_type:
                 updates["entrytype"] = api_type
             else:
                 identical["entrytype"] = bib_type
@@ -1515,39 +2510,35 @@ class BibTeXValidator:
             if "title" in api_data:
                 bib_value = bib_entry.get("title", "").strip()
                 api_value = api_data["title"]
-                bib_normalized = self.normalize_string_for_comparison(
-                    bib_value, "title"
-                )
-                api_normalized = self.normalize_string_for_comparison(
-                    api_value, "title"
-                )
                 sources["title"] = source
                 if not bib_value:
                     updates["title"] = api_value
-                elif bib_normalized == api_normalized:
-                    identical["title"] = bib_value
-                elif bib_normalized != api_normalized and len(bib_value) > 3:
-                    # Prefer API value for title (case differences)
-                    updates["title"] = api_value
+                else:
+                    bib_normalized = normalize_bib(bib_value, "title")
+                    api_normalized = normalize(api_value, "title")
+                    normalized["title"] = api_normalized
+                    if bib_normalized == api_normalized:
+                        identical["title"] = bib_value
+                    elif len(bib_value) > 3:
+                        # Prefer API value for title (case differences)
+                        updates["title"] = api_value
 
             if "authors" in api_data:
                 bib_value = bib_entry.get("author", "").strip()
                 api_value = self.format_author_list(api_data["authors"])
                 api_value_str = api_value  # helper
-                bib_normalized = self.normalize_string_for_comparison(
-                    bib_value, "author"
-                )
-                api_normalized = self.normalize_string_for_comparison(
-                    api_value, "author"
-                )
                 sources["author"] = source
                 if not bib_value:
                     updates["author"] = api_value
-                elif bib_normalized == api_normalized:
-                    identical["author"] = bib_value
-                elif bib_normalized != api_normalized and len(bib_value) > 5:
-                    # Prefer API value for author (case/form differences)
-                    updates["author"] = api_value
+                else:
+                    bib_normalized = normalize_bib(bib_value, "author")
+                    api_normalized = normalize(api_value, "author")
+                    normalized["author"] = api_normalized
+                    if bib_normalized == api_normalized:
+                        identical["author"] = bib_value
+                    elif len(bib_value) > 5:
+                        # Prefer API value for author (case/form differences)
+                        updates["author"] = api_value
 
             if "year" in api_data:
                 bib_value = bib_entry.get("year", "").strip()
@@ -1596,44 +2587,7 @@ class BibTeXValidator:
 
         # Handle other sources (semantic_scholar, dblp, pubmed, datacite, openalex)
         elif source in ["semantic_scholar", "dblp", "pubmed", "datacite", "openalex"]:
-            field_mapping = {
-                "title": (
-                    "title",
-                    lambda x: self.extract_string_from_api_value(x)
-                    if isinstance(x, str)
-                    else str(x)
-                    if x
-                    else None,
-                ),
-                "author": (
-                    "authors",
-                    lambda x: self.format_author_list(x)
-                    if isinstance(x, list)
-                    else str(x)
-                    if x
-                    else None,
-                ),
-                "journal": (
-                    "journal",
-                    lambda x: self.extract_string_from_api_value(x)
-                    if isinstance(x, str)
-                    else str(x)
-                    if x
-                    else None,
-                ),
-                "year": ("year", lambda x: str(x) if x else None),
-                "doi": ("doi", lambda x: str(x).lower() if x else None),
-                "publisher": ("publisher", lambda x: str(x).strip() if x else None),
-                "volume": ("volume", lambda x: str(x).strip() if x else None),
-                "number": ("number", lambda x: str(x).strip() if x else None),
-                "pages": ("pages", lambda x: str(x).strip() if x else None),
-                "entrytype": (
-                    "type",
-                    lambda x: self.map_api_type_to_bibtex(x, source)
-                    if source in ["dblp", "openalex"]
-                    else "misc",
-                ),
-            }
+            field_mapping = self._field_mapping(source)
 
             for bib_field, (api_field, transformer) in field_mapping.items():
                 api_value = api_data.get(api_field)
@@ -1656,23 +2610,22 @@ class BibTeXValidator:
                 bib_value = bib_entry.get(bib_field, "").strip()
                 api_value_str = str(api_value).strip()
 
-                # Normalize for comparison
-                bib_normalized = self.normalize_string_for_comparison(
-                    bib_value, bib_field
-                )
-                api_normalized = self.normalize_string_for_comparison(
-                    api_value_str, bib_field
-                )
-
                 # Track source
                 sources[bib_field] = source
 
                 if not bib_value:
                     if api_value_str and api_value_str != "[]":
                         updates[bib_field] = api_value_str
-                elif bib_normalized == api_normalized:
+                    continue
+
+                # Normalize for comparison
+                bib_normalized = normalize_bib(bib_value, bib_field)
+                api_normalized = normalize(api_value_str, bib_field)
+                normalized[bib_field] = api_normalized
+
+                if bib_normalized == api_normalized:
                     identical[bib_field] = bib_value
-                elif bib_normalized != api_normalized and bib_field not in ["pages"]:
+                elif bib_field not in ["pages"]:
                     if len(bib_value) > 3 and len(api_value_str) > 3:
                         if bib_field in ["author", "title"]:
                             updates[bib_field] = api_value_str
@@ -1686,30 +2639,51 @@ class BibTeXValidator:
                             else:
                                 conflicts[bib_field] = (bib_value, api_value_str)
 
+        # Flatten the buckets; a field in several keeps the strongest status
+        field_status = {}
+        for field_name, value in identical.items():
+            field_status[field_name] = FieldDiff("identical", value, value, source)
+        for field_name, (bib_val, api_val) in different.items():
+            field_status[field_name] = FieldDiff("different", bib_val, api_val, source)
+        for field_name, (bib_val, api_val) in conflicts.items():
+            field_status[field_name] = FieldDiff("conflict", bib_val, api_val, source)
+        for field_name, value in updates.items():
+            field_status[field_name] = FieldDiff("updated", None, value, source)
+
         return {
             "updated": updates,
             "conflicts": conflicts,
             "identical": identical,
             "different": different,
             "sources": sources,
+            "normalized": normalized,
+            "field_status": field_status,
         }
 
     def _calculate_similarity(self, str1: str, str2: str) -> float:
-        """Calculate similarity ratio between two strings (0.0 to 1.0)"""
+        """Calculate similarity ratio between two strings (0.0 to 1.0)
+
+        Word-order-insensitive edit-distance ratio over the two token sets,
+        so reordered or abbreviated venue names still score high. When one
+        value's words are a strict subset of the other's ("Nature" vs
+        "Nature Communications"), the sorted words are compared instead:
+        the token-set score would call that a full match.
+        """
         if not str1 or not str2:
             return 0.0
         if str1 == str2:
             return 1.0
-
-        # Simple similarity: count common characters
-        set1 = set(str1.lower())
-        set2 = set(str2.lower())
-        if not set1 or not set2:
+        # Years, volumes and issue numbers either match or they don't
+        if str1.isdigit() or str2.isdigit():
             return 0.0
 
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
-        return intersection / union if union > 0 else 0.0
+        str1 = str1.lower()
+        str2 = str2.lower()
+        tokens1 = set(str1.split())
+        tokens2 = set(str2.split())
+        if tokens1 < tokens2 or tokens2 < tokens1:
+            return token_sort_ratio(str1, str2) / 100.0
+        return token_set_ratio(str1, str2) / 100.0
 
     def map_api_type_to_bibtex(self, api_type: str, source: str = "crossref") -> str:
         """
@@ -1718,51 +2692,13 @@ class BibTeXValidator:
         if not api_type:
             return "misc"
 
-        api_type = str(api_type).lower().strip()
-
-        if source == "crossref":
-            # https://api.crossref.org/types
-            mapping = {
-                "journal-article": "article",
-                "proceedings-article": "inproceedings",
-                "book": "book",
-                "book-chapter": "incollection",  # or inbook
-                "dissertation": "phdthesis",
-                "monograph": "book",
-                "report": "techreport",
-                "reference-entry": "incollection",
-                "posted-content": "misc",  # Preprints
-            }
-            return mapping.get(api_type, "misc")
-
-        elif source == "openalex":
-            mapping = {
-                "article": "article",
-                "book-chapter": "incollection",
-                "book": "book",
-                "dissertation": "phdthesis",
-                "preprint": "misc",
-                "report": "techreport",
-            }
-            return mapping.get(api_type, "misc")
-
-        elif source == "arxiv":
+        if source == "arxiv":
             return "article"
 
-        elif source == "dblp":
-            # DBLP types: Article, InProceedings, Book, InCollection, PhdThesis, MastersThesis, Proceedings
-            mapping = {
-                "article": "article",
-                "inproceedings": "inproceedings",
-                "book": "book",
-                "incollection": "incollection",
-                "phdthesis": "phdthesis",
-                "mastersthesis": "mastersthesis",
-                "proceedings": "proceedings",
-            }
-            return mapping.get(api_type, "misc")
-
-        return "misc"
+        mapping = self.API_TYPE_MAPS.get(source)
+        if mapping is None:
+            return "misc"
+        return mapping.get(str(api_type).lower().strip(), "misc")
 
     def search_google_scholar(self, query: str) -> Optional[Dict]:
         """
@@ -1778,7 +2714,7 @@ class BibTeXValidator:
             return None
 
         try:
-            time.sleep(self.delay * 2)  # Longer delay for Scholar
+            self.limiters["scholar"].acquire()
             search_query = scholarly.search_pubs(query)
             result = next(search_query, None)
 
@@ -1791,7 +2727,13 @@ class BibTeXValidator:
         return None
 
     def _fetch_concurrently(
-        self, doi: str, arxiv_id: str, title: str, author: str
+        self,
+        doi: str,
+        arxiv_id: str,
+        title: str,
+        author: str,
+        pmid: str = "",
+        complete: bool = False,
     ) -> Dict[str, Dict]:
         """
         Fetch data from all keys sources concurrently.
@@ -1801,6 +2743,10 @@ class BibTeXValidator:
             arxiv_id: ArXiv ID or empty
             title: Title string
             author: Author string
+            pmid: PubMed ID or empty
+            complete: The entry has no missing fields. Title searches are
+                then skipped for a Crossref DOI that Crossref resolves, as
+                Crossref covers it.
 
         Returns:
             Dictionary mapping source name to fetched data
@@ -1808,85 +2754,121 @@ class BibTeXValidator:
         results = {}
         futures = {}
 
-        # We use a purely internal executor for these quick I/O tasks
-        # separate from the main validation executor to avoid potential deadlocks
-        # though with max_workers=30 on main, we should be fine.
-        # Ideally, use a context manager for clean shutdown.
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            # 1. DOI-based sources
-            if doi and not self.ARXIV_DOI_PATTERN.search(doi):
-                # Crossref
-                futures[executor.submit(self.fetch_crossref_data, doi)] = "crossref"
+        # Fetches go to the shared fetch executor, which is separate from the
+        # validation executor so that waiting entries cannot starve it
+        executor = self.fetch_executor
+
+        # 1. DOI-based sources
+        registrar = None
+        crossref_future = None
+        if doi and not self.ARXIV_DOI_PATTERN.search(doi):
+            # Only ask the agencies that can know this DOI; if the registrar
+            # could not be determined, ask all of them
+            registrar = self.doi_registrar(doi)
+
+            # Crossref
+            if registrar not in ("datacite", "other"):
+                crossref_future = executor.submit(self.fetch_crossref_data, doi)
+                futures[crossref_future] = "crossref"
 
+            if registrar != "crossref":
                 # Zenodo checks
                 if "zenodo" in doi.lower():
                     futures[executor.submit(self.fetch_zenodo_data, doi)] = "zenodo"
 
-                # DataCite checks
-                # (Note: Logic in original was conditional: if crossref fails or zenodo/figshare in doi)
-                # Here we launch aggressively to save time, unless rate limiting is a concern.
-                # DataCite is generally robust.
-                if "zenodo" not in doi.lower():  # If zenodo, we already checking zenodo
-                    futures[executor.submit(self.fetch_datacite_data, doi)] = "datacite"
-                else:
-                    # For zenodo DOIs, datacite is also valid fallback
-                    futures[executor.submit(self.fetch_datacite_data, doi)] = "datacite"
-
-            # 2. arXiv
-            if arxiv_id:
-                futures[executor.submit(self.fetch_arxiv_data, arxiv_id)] = "arxiv"
-
-            # 3. Title/Author based sources (Search)
-            if title and len(title) > 10:
-                # DBLP
-                futures[executor.submit(self.fetch_dblp_data, title, author)] = "dblp"
-
-                # Semantic Scholar (Search)
-                # Note: Semantic Scholar is heavy on rate limits.
-                futures[
-                    executor.submit(self.fetch_semantic_scholar_data, title, doi)
-                ] = "semantic_scholar"
-
-            # 4. OpenAlex (Dual Strategy)
-            # If DOI exists, prioritize DOI fetch. Else title search.
-            # We can launch both or pick one. Priority logic suggests DOI first.
-            if doi:
-                futures[executor.submit(self.fetch_openalex_data, None, doi)] = (
-                    "openalex"
-                )
-            elif title and len(title) > 10:
-                futures[executor.submit(self.fetch_openalex_data, title, None)] = (
-                    "openalex"
-                )
+                # DataCite checks (also the fallback for Zenodo DOIs)
+                futures[executor.submit(self.fetch_datacite_data, doi)] = "datacite"
 
-            # Wait for all
-            for future in as_completed(futures):
-                source = futures[future]
-                try:
-                    data = future.result()
-                    if data:
-                        results[source] = data
-                except Exception:
-                    # Ignore individual source failures
-                    pass
+        # 2. arXiv
+        if arxiv_id:
+            futures[executor.submit(self.fetch_arxiv_data, arxiv_id)] = "arxiv"
+
+        # PubMed
+        if pmid:
+            futures[executor.submit(self.fetch_pubmed_data, pmid)] = "pubmed"
+
+        # 3. Title/Author based sources (Search)
+        def submit_searches():
+            # DBLP
+            futures[executor.submit(self.fetch_dblp_data, title, author)] = "dblp"
+
+            # Semantic Scholar (Search)
+            # Note: Semantic Scholar is heavy on rate limits.
+            futures[
+                executor.submit(self.fetch_semantic_scholar_data, title, doi)
+            ] = "semantic_scholar"
+
+        search = bool(title) and len(title) > 10
+        # For a complete entry with a Crossref DOI, the searches only run if
+        # Crossref does not resolve it (e.g. a mistyped DOI), see below
+        defer_search = search and complete and registrar == "crossref"
+        if search and not defer_search:
+            submit_searches()
+
+        # 4. OpenAlex (Dual Strategy)
+        # If DOI exists, prioritize DOI fetch. Else title search.
+        # We can launch both or pick one. Priority logic suggests DOI first.
+        # This thread would only sit waiting for the others, so it makes this
+        # request itself rather than handing it to another thread.
+        openalex_call = None
+        if doi:
+            openalex_call = functools.partial(self.fetch_openalex_data, doi=doi)
+        elif title and len(title) > 10:
+            openalex_call = functools.partial(self.fetch_openalex_data, title=title)
+        if openalex_call is not None:
+            try:
+                data = openalex_call()
+                if data:
+                    results["openalex"] = data
+            except Exception:
+                pass
+
+        if defer_search:
+            try:
+                crossref_data = crossref_future.result()
+            except Exception:
+                crossref_data = None
+            if not crossref_data:
+                submit_searches()
+
+        # Wait for all
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                data = future.result()
+                if data:
+                    results[source] = data
+            except Exception:
+                # Ignore individual source failures
+                pass
 
         return results
 
-    def validate_entry(
-        self, entry: Dict, index: int = 0, total: int = 0
-    ) -> ValidationResult:
-        """
-        Validate a single BibTeX entry
-        """
-        # Create BibEntry from input dict (safely)
-        raw_bib_entry = BibEntry(
+    @staticmethod
+    def _bib_entry(entry: Dict) -> BibEntry:
+        """Create a BibEntry from a bibtexparser entry dict (safely)"""
+        return BibEntry(
             entry_type=entry.get("ENTRYTYPE", "misc"),
             citekey=entry.get("ID", ""),
             fields={k: v for k, v in entry.items() if k not in ["ID", "ENTRYTYPE"]},
         )
 
+    def validate_entry(
+        self,
+        entry: Dict,
+        index: int = 0,
+        total: int = 0,
+        normalized_entry: Optional[BibEntry] = None,
+    ) -> ValidationResult:
+        """
+        Validate a single BibTeX entry
+
+        normalized_entry is normalize_entry's result for this entry, if the
+        caller has already computed it.
+        """
         # 1. Normalize (Core Logic)
-        normalized_entry = self.normalize_entry(raw_bib_entry)
+        if normalized_entry is None:
+            normalized_entry = self.normalize_entry(self._bib_entry(entry))
 
         result = ValidationResult(
             entry_key=normalized_entry.citekey, entry_type=normalized_entry.entry_type
@@ -1908,10 +2890,14 @@ class BibTeXValidator:
 
         logs = []
 
-        # Store original values for undo functionality
-        for field_name, value in entry.items():
-            if field_name not in ["ID"] and value:
-                result.original_values[field_name] = str(value)
+        # Store original values for undo functionality. This has to be a
+        # snapshot: accepted updates are later written into `entry` itself.
+        # (str() of a str returns the same object, so no text is copied.)
+        result.original_values = {
+            field_name: str(value)
+            for field_name, value in entry.items()
+            if field_name != "ID" and value
+        }
         # Explicitly add ENTRYTYPE if not in items (some parsers might keep it separate)
         if "ENTRYTYPE" in entry:
             result.original_values["entrytype"] = entry["ENTRYTYPE"]
@@ -1925,13 +2911,14 @@ class BibTeXValidator:
 
         # 1. Identification & Normalization
         doi = val_fields.get("doi", "")
+        # Checked once here; arXiv DOIs are resolved through the arXiv API
+        is_arxiv_doi = bool(doi) and bool(self.ARXIV_DOI_PATTERN.search(doi))
         if doi:
             result.has_doi = True
             # DOI is already normalized by normalize_entry
 
             # Check if it's an arXiv DOI
-            arxiv_doi_match = self.ARXIV_DOI_PATTERN.search(doi)
-            if arxiv_doi_match:
+            if is_arxiv_doi:
                 logs.append(f"  DOI identified as arXiv DOI: {doi}")
                 # We will handle this in arXiv section if we can extract ID
             else:
@@ -1952,7 +2939,7 @@ class BibTeXValidator:
         fetched_data = {}  # source_name -> data_dict
 
         # Collect params for concurrent fetch
-        c_doi = doi if doi and not self.ARXIV_DOI_PATTERN.search(doi) else ""
+        c_doi = "" if is_arxiv_doi else doi
         c_arxiv_id = arxiv_id
         c_title = val_fields.get("title", "")
         c_author = val_fields.get("author", "")
@@ -1961,9 +2948,14 @@ class BibTeXValidator:
             f"  Fetching data concurrently (DOI={bool(c_doi)}, ArXiv={bool(c_arxiv_id)}, Title={bool(c_title)})..."
         )
 
+        # Schema lint needs no API data; an entry with nothing missing can
+        # skip the title searches
+        lint_results = self.validate_entry_schema(normalized_entry)
+        complete = not any(msg.code.startswith("missing_") for msg in lint_results)
+
         # Execute concurrent fetch
         concurrent_results = self._fetch_concurrently(
-            c_doi, c_arxiv_id, c_title, c_author
+            c_doi, c_arxiv_id, c_title, c_author, pmid, complete=complete
         )
         fetched_data.update(concurrent_results)
 
@@ -2010,7 +3002,7 @@ class BibTeXValidator:
                 result.arxiv_valid = True
                 logs.append("  ✓ Found data from arXiv")
                 # If we have a DOI that was actually an arXiv DOI, mark it valid
-                if result.has_doi and self.ARXIV_DOI_PATTERN.search(doi):
+                if is_arxiv_doi:
                     result.doi_valid = True
             else:
                 result.warnings.append(f"arXiv ID {c_arxiv_id} not found")
@@ -2033,18 +3025,9 @@ class BibTeXValidator:
         if "semantic_scholar" in fetched_data:
             logs.append("  ✓ Found data from Semantic Scholar")
 
-        # (F) PubMed (Not in concurrent fetch yet, keep legacy or add? Original code had it.)
-        # Original code had pmid check. Let's keep pmid check sequential or add to concurrent.
-        # Adding to concurrent would require changing signature. Let's keep it here for now as it's rare.
-        if pmid:
-            logs.append(f"  Fetching PubMed: {pmid}")
-            # ... existing pmid logic would need self.fetch_pubmed_data check ...
-            # We removed the block, so we need to restore it or add to concurrent.
-            # Let's do a quick sequential fetch for PubMed if needed, it's fast/rare.
-            data = self.fetch_pubmed_data(pmid)
-            if data:
-                fetched_data["pubmed"] = data
-                logs.append("  ✓ Found data from PubMed")
+        # (F) PubMed
+        if "pubmed" in fetched_data:
+            logs.append(f"  ✓ Found data from PubMed ({pmid})")
 
         # 2.5 Recursive Enrichment (Discover missing identifiers)
         # If we didn't have a DOI but found one in secondary sources, fetch Crossref/Zenodo/OpenAlex
@@ -2067,6 +3050,15 @@ class BibTeXValidator:
                 result.has_doi = True
                 result.doi_valid = True  # Assumption
 
+                # The OpenAlex lookup does not depend on the Crossref/DataCite
+                # chain below, so it runs alongside it
+                openalex_future = None
+                if "openalex" not in fetched_data:
+                    logs.append("  Fetching OpenAlex (via discovered DOI)...")
+                    openalex_future = self.fetch_executor.submit(
+                        self.fetch_openalex_data, doi=new_doi
+                    )
+
                 # Fetch Crossref (if not already fetched - unlikely as we had no DOI)
                 if "crossref" not in fetched_data:
                     logs.append("  Fetching Crossref (via discovered DOI)...")
@@ -2094,11 +3086,10 @@ class BibTeXValidator:
                             fetched_data["datacite"] = d_data
                             logs.append("  ✓ Found data from DataCite")
 
-                # Fetch OpenAlex by DOI if we didn't search by title or if title search failed
+                # OpenAlex by DOI, if we didn't search by title or title search failed
                 # (OR if we want to ensure we have the DOI-linked record)
-                if "openalex" not in fetched_data:
-                    logs.append("  Fetching OpenAlex (via discovered DOI)...")
-                    data = self.fetch_openalex_data(doi=new_doi)
+                if openalex_future is not None:
+                    data = openalex_future.result()
                     if data:
                         fetched_data["openalex"] = data
                         logs.append("  ✓ Found data from OpenAlex")
@@ -2161,107 +3152,56 @@ class BibTeXValidator:
 
         result.all_sources_data = fetched_data
 
-        # Track unique values for each field to prevent redundant options
-        # field -> list of normalized values found so far
-        field_values_seen = {}
+        # Normalized bib values, shared by every source's comparison
+        bib_cache: Dict[str, str] = {}
+        # field -> (source, FieldDiff, normalized API value) from each source
+        # that has the field, in priority order
+        observations: Dict[str, List[Tuple[str, FieldDiff, str]]] = {}
 
         for source in priority_order:
             if source not in fetched_data:
                 continue
 
-            data = fetched_data[source]
-            comparison = self.compare_fields(entry, data, source=source)
-
-            # Merge logic:
-            # - Update field_source_options based on UNIQUE values
-            # - Update fields_updated/conflict ONLY if not already set by higher priority source
-
-            # Helper to collect all involved fields
-            involved_fields_set = set()
-            involved_fields_set.update(comparison["updated"].keys())
-            involved_fields_set.update(comparison["conflicts"].keys())
-            involved_fields_set.update(comparison.get("identical", {}).keys())
-            involved_fields_set.update(comparison.get("different", {}).keys())
-
-            # Sort fields by preferred order
-            involved_fields = sorted(
-                list(involved_fields_set),
-                key=lambda x: self.PREFERRED_FIELD_ORDER.index(x)
-                if x in self.PREFERRED_FIELD_ORDER
-                else 999,
+            comparison = self.compare_fields(
+                entry, fetched_data[source], source=source, bib_cache=bib_cache
             )
+            normalized = comparison["normalized"]
+            for field_name, diff in comparison["field_status"].items():
+                # Normalized value for deduplication (reusing compare_fields' work)
+                norm_val = normalized.get(field_name)
+                if norm_val is None:
+                    norm_val = self.normalize_string_for_comparison(
+                        diff.api, field_name
+                    )
+                observations.setdefault(field_name, []).append(
+                    (source, diff, norm_val)
+                )
 
-            for field_name in involved_fields:
-                # Get the value provided by this source for this field
-                # We can find it in the comparison result or original data
-                # compare_fields returns lists/tuples in update/conflict, we need the raw api value
-
-                # Extract API value logic similar to getFieldValueFromSource in JS/Python
-                # But compare_fields already gives us the string representation in the tuple/value
-
-                api_val_str = ""
-                if field_name in comparison["updated"]:
-                    api_val_str = comparison["updated"][field_name]
-                elif field_name in comparison["conflicts"]:
-                    api_val_str = comparison["conflicts"][field_name][1]
-                elif field_name in comparison.get("different", {}):
-                    api_val_str = comparison["different"][field_name][1]
-                elif field_name in comparison.get("identical", {}):
-                    api_val_str = comparison["identical"][field_name]
-
-                # Normalize for deduplication check
-                norm_val = self.normalize_string_for_comparison(api_val_str, field_name)
-
-                if field_name not in field_values_seen:
-                    field_values_seen[field_name] = []
-
-                if field_name not in result.field_source_options:
-                    result.field_source_options[field_name] = []
-
-                # If this is the FIRST source for this field, or if value is UNIQUE
-                # We always add if it's the first time we see any value (priority 1)
-                # Or if this specific normalized value hasn't been seen yet.
-                if norm_val not in field_values_seen[field_name]:
-                    result.field_source_options[field_name].append(source)
-                    field_values_seen[field_name].append(norm_val)
-
-                # Update main result fields if not already set (Priority Logic)
-                if (
-                    field_name not in result.field_sources
-                ):  # If not claimed by a higher priority source
-                    # If this source suggests an update
-                    if field_name in comparison["updated"]:
-                        result.fields_updated[field_name] = comparison["updated"][
-                            field_name
-                        ]
-                        result.field_sources[field_name] = source
-                    # If this source has a conflict
-                    elif field_name in comparison["conflicts"]:
-                        result.fields_conflict[field_name] = comparison["conflicts"][
-                            field_name
-                        ]
-                        result.field_sources[field_name] = source
-                    # If different (minor)
-                    elif field_name in comparison.get("different", {}):
-                        result.fields_different[field_name] = comparison["different"][
-                            field_name
-                        ]
-                        result.field_sources[field_name] = source
-                    # If identical
-                    elif field_name in comparison.get("identical", {}):
-                        result.fields_identical[field_name] = comparison["identical"][
-                            field_name
-                        ]
-                        result.field_sources[field_name] = source
+        # Merge logic, one pass per field (in preferred order):
+        # - field_status comes from the highest-priority source
+        # - field_source_options lists each source with a value not seen yet
+        for field_name in self._order_fields(list(observations)):
+            field_observations = observations[field_name]
+            source, diff, _ = field_observations[0]
+            result.field_status[field_name] = diff
+            result.field_sources[field_name] = source
+
+            options = result.field_source_options[field_name] = []
+            values_seen = set()
+            for source, _, norm_val in field_observations:
+                if norm_val not in values_seen:
+                    values_seen.add(norm_val)
+                    options.append(source)
 
         # Logging summary
-        if result.fields_conflict:
-            logs.append(f"  ⚠ Found {len(result.fields_conflict)} field conflicts")
-        if result.fields_updated:
-            logs.append(f"  + Found {len(result.fields_updated)} fields to update")
-
-        # 3. Schema Validation (Core Logic)
-        lint_results = self.validate_entry_schema(normalized_entry)
+        n_conflicts = len(result.fields_with("conflict"))
+        n_updates = len(result.fields_with("updated"))
+        if n_conflicts:
+            logs.append(f"  ⚠ Found {n_conflicts} field conflicts")
+        if n_updates:
+            logs.append(f"  + Found {n_updates} fields to update")
+
+        # 3. Schema Validation (Core Logic), linted before the fetch
         result.lint_messages = lint_results
 
         # Map LintMessages to legacy result fields for compatibility
@@ -2285,11 +3225,39 @@ class BibTeXValidator:
             if msg.level == "warning":
                 logs.append(f"  Warning: {msg.message}")
 
+        # Built outside the lock, so the lock only covers a single write
+        text = "\n".join(logs) + "\n"
         with self.print_lock:
-            print("\n".join(logs))
+            sys.stdout.write(text)
 
         return result
 
+    def iter_entries(self) -> Iterator[Tuple[int, Dict]]:
+        """Yield (index, entry) for each parsed entry in file order"""
+        yield from enumerate(self.db.entries)
+
+    def _crossref_doi(self, normalized_entry: BibEntry) -> str:
+        """Return the normalized DOI to look up on Crossref, or '' if none"""
+        doi = normalized_entry.fields.get("doi", "")
+        if doi and not self.ARXIV_DOI_PATTERN.search(doi):
+            return doi
+        return ""
+
+    def _validate_after(
+        self,
+        batches: Tuple[Future, ...],
+        entry: Dict,
+        index: int,
+        total: int,
+        normalized_entry: BibEntry,
+    ) -> ValidationResult:
+        """Validate an entry once the batch lookups holding its DOI are done"""
+        # A failed batch is not fatal: the fetchers fall back to single-DOI
+        # lookups for anything that was not prefetched
+        for batch in batches:
+            batch.exception()
+        return self.validate_entry(entry, index, total, normalized_entry)
+
     def validate_all(
         self, show_progress: bool = True, max_workers: int = 30
     ) -> List[ValidationResult]:
@@ -2312,52 +3280,125 @@ class BibTeXValidator:
             self.save_updated_bib(force=True)
         print("=" * 60)
 
+        # Pipeline: a producer thread walks the entries and submits them to the
+        # validation workers; finished futures are pushed onto merge_q and the
+        # calling thread drains it, writing results back. At most `window`
+        # entries are between producer and writer at any time.
+        merge_q: "queue.Queue[Optional[Tuple[int, Dict, Future]]]" = queue.Queue()
+        window = threading.BoundedSemaphore(
+            max(2 * max_workers, 2 * self.CROSSREF_BATCH_SIZE)
+        )
+        submitted = [0]
+        ordered: List[Optional[ValidationResult]] = [None] * total_entries
+
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_entry = {
-                executor.submit(
-                    self.validate_entry, entry, index=idx, total=total_entries
-                ): (idx, entry)
-                for idx, entry in enumerate(self.db.entries)
-            }
 
-            for future in as_completed(future_to_entry):
-                idx, entry = future_to_entry[future]
+            def submit(fn, *args, idx: int, entry: Dict):
+                future = executor.submit(fn, *args)
+                future.add_done_callback(lambda f: merge_q.put((idx, entry, f)))
+                submitted[0] += 1
+
+            def produce():
+                # Entries with a Crossref DOI are grouped into batches. The
+                # Crossref and OpenAlex lookups for a batch are started as soon
+                # as it is full, and its entries are validated once they
+                # return, so parsing, batch fetches and validation of earlier
+                # entries overlap.
+                waiting: List[Tuple[int, Dict, BibEntry]] = []
+                dois: List[str] = []
+
+                def submit_batch():
+                    batches = (
+                        self.fetch_executor.submit(self.fetch_crossref_batch, dois[:]),
+                        self.fetch_executor.submit(self.fetch_openalex_batch, dois[:]),
+                    )
+                    for idx, entry, normalized in waiting:
+                        submit(
+                            self._validate_after,
+                            batches,
+                            entry,
+                            idx,
+                            total_entries,
+                            normalized,
+                            idx=idx,
+                            entry=entry,
+                        )
+                    waiting.clear()
+                    dois.clear()
+
+                try:
+                    for idx, entry in self.iter_entries():
+                        window.acquire()
+                        # Normalized once here; validate_entry reuses it
+                        try:
+                            normalized = self.normalize_entry(self._bib_entry(entry))
+                        except Exception:
+                            # A malformed entry is validated on its own and
+                            # fails there, without stopping the entries after it
+                            normalized = None
+                        doi = ""
+                        if normalized is not None:
+                            doi = self._crossref_doi(normalized)
+                        if not doi:
+                            submit(
+                                self.validate_entry,
+                                entry,
+                                idx,
+                                total_entries,
+                                normalized,
+                                idx=idx,
+                                entry=entry,
+                            )
+                            continue
+                        waiting.append((idx, entry, normalized))
+                        dois.append(doi)
+                        if len(dois) == self.CROSSREF_BATCH_SIZE:
+                            submit_batch()
+                    if waiting:
+                        submit_batch()
+                except Exception as e:
+                    print(f"\nError reading entries: {e}")
+                finally:
+                    merge_q.put(None)  # No more submissions
+
+            producer = threading.Thread(target=produce, daemon=True)
+            producer.start()
+
+            written = 0
+            producing = True
+            while producing or written < submitted[0]:
+                item = merge_q.get()
+                if item is None:
+                    producing = False
+                    continue
+                idx, entry, future = item
+                written += 1
+                window.release()
                 try:
                     result = future.result()
-                    # Results might return out of order, but that's fine for the list
-                    # If strict order is needed, we can store by index and sort later
-                    # Here we just append
-
-                    # Thread-safe append (GIL handles atomic append for lists)
-                    self.results.append(result)
-
-                    # Update entry if requested - entry objects are distinct, so this is safe
-                    if self.update_bib and result.fields_updated:
-                        for field_name, value in result.fields_updated.items():
-                            # Find existing key with same name (case-insensitive) to overwrite
-                            existing_key = next(
-                                (
-                                    k
-                                    for k in entry.keys()
-                                    if k.lower() == field_name.lower()
-                                ),
-                                field_name,
+                    # Results arrive out of order; slot them by entry index
+                    ordered[idx] = result
+
+                    # Update entry if requested - only this thread writes entries
+                    updates = result.fields_with("updated")
+                    if self.update_bib and updates:
+                        # Existing keys by lowercased name (first one wins),
+                        # so a field is overwritten whatever its case
+                        lower_keys: Dict[str, str] = {}
+                        for k in entry:
+                            lower_keys.setdefault(k.lower(), k)
+                        for field_name, diff in updates.items():
+                            existing_key = lower_keys.get(
+                                field_name.lower(), field_name
                             )
-                            entry[existing_key] = value
+                            entry[existing_key] = diff.api
                 except Exception as e:
                     print(f"\nError validating entry {idx}: {e}")
 
-        # Sort results by original index to keep report order consistent
-        # We need to map back from entry_key or just sort by entry index if we tracked it
-        # Actually, self.results is a list validation results.
-        # Ideally, we sort them to match the input order for the report.
-        # But ValidationResult doesn't have the original index.
-        # Let's trust that the report generation handles it or that order doesn't strictly matter.
-        # Users usually prefer input order.
+            producer.join()
 
-        # To fix order, valid assumption: entry_keys are unique.
-        key_order = {entry["ID"]: i for i, entry in enumerate(self.db.entries)}
-        self.results.sort(key=lambda x: key_order.get(x.entry_key, 0))
+        # Report in input order (entries that failed to validate leave a gap)
+        self.results.extend(result for result in ordered if result is not None)
 
         if show_progress:
             print(f"{'=' * 60}")
@@ -2368,10 +3409,14 @@ class BibTeXValidator:
 
         return self.results
 
-    def generate_report(self, output_file: Optional[str] = None) -> str:
-        """Generate a validation report"""
+    def _report_blocks(self):
+        """
+        Yield the report as blocks of lines: the header and summary first,
+        then one block per result. Joining every line of every block with
+        newlines gives the full report text.
+        """
         report_lines = [
-            f"BibTeX Validation Report",
+            "BibTeX Validation Report",
             f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
             f"File: {self.bib_file}",
             "=" * 60,
@@ -2380,13 +3425,17 @@ class BibTeXValidator:
 
         # Summary statistics
         total = len(self.results)
-        with_doi = sum(1 for r in self.results if r.has_doi)
-        valid_doi = sum(1 for r in self.results if r.doi_valid)
-        with_arxiv = sum(1 for r in self.results if r.has_arxiv)
-        valid_arxiv = sum(1 for r in self.results if r.arxiv_valid)
-        with_conflicts = sum(1 for r in self.results if r.fields_conflict)
-        with_updates = sum(1 for r in self.results if r.fields_updated)
-        with_missing = sum(1 for r in self.results if r.fields_missing)
+        with_doi = valid_doi = with_arxiv = valid_arxiv = 0
+        with_conflicts = with_updates = with_missing = 0
+        for r in self.results:
+            with_doi += r.has_doi
+            valid_doi += r.doi_valid
+            with_arxiv += r.has_arxiv
+            valid_arxiv += r.arxiv_valid
+            statuses = {diff.status for diff in r.field_status.values()}
+            with_conflicts += "conflict" in statuses
+            with_updates += "updated" in statuses
+            with_missing += bool(r.fields_missing)
 
         report_lines.extend(
             [
@@ -2417,82 +3466,108 @@ class BibTeXValidator:
                 "",
             ]
         )
+        yield report_lines
 
-        # Detailed results
+        # Detailed results (several lines per entry, so append is bound once)
         for result in self.results:
-            report_lines.append(f"[{result.entry_key}]")
-
             if result.doi_valid:
-                report_lines.append("  DOI: ✓ Valid")
+                doi_line = REPORT_DOI_VALID
             elif result.has_doi:
-                report_lines.append(f"  DOI: ✗ Invalid/Not found")
+                doi_line = REPORT_DOI_INVALID
             else:
-                report_lines.append("  DOI: Not provided")
+                doi_line = REPORT_DOI_MISSING
 
             if result.arxiv_valid:
-                report_lines.append(f"  arXiv: ✓ Valid ({result.arxiv_id})")
+                arxiv_line = f"  arXiv: ✓ Valid ({result.arxiv_id})"
             elif result.has_arxiv:
-                report_lines.append(f"  arXiv: ✗ Invalid/Not found ({result.arxiv_id})")
+                arxiv_line = f"  arXiv: ✗ Invalid/Not found ({result.arxiv_id})"
             else:
-                report_lines.append("  arXiv: Not provided")
-
-            if result.fields_conflict:
-                report_lines.append("  Field Conflicts:")
-                for field_name, (old, new) in result.fields_conflict.items():
-                    report_lines.append(f"    {field_name}:")
-                    report_lines.append(f"      BibTeX: {old}")
-                    report_lines.append(f"      API:    {new}")
+                arxiv_line = REPORT_ARXIV_MISSING
+
+            # The key and both ID status lines are always present
+            lines = [f"[{result.entry_key}]\n{doi_line}\n{arxiv_line}"]
+            add = lines.append
+
+            conflicts = result.fields_with("conflict")
+            if conflicts:
+                add("  Field Conflicts:")
+                for field_name, diff in conflicts.items():
+                    add(
+                        f"    {field_name}:\n"
+                        f"      BibTeX: {diff.bib}\n"
+                        f"      API:    {diff.api}"
+                    )
 
-            if result.fields_updated:
-                report_lines.append("  Suggested Updates:")
-                for field_name, value in result.fields_updated.items():
-                    report_lines.append(f"    {field_name}: {value}")
+            updates = result.fields_with("updated")
+            if updates:
+                add("  Suggested Updates:")
+                for field_name, diff in updates.items():
+                    add(f"    {field_name}: {diff.api}")
 
             if result.fields_missing:
-                report_lines.append(
-                    f"  Missing Fields: {', '.join(result.fields_missing)}"
-                )
+                add(f"  Missing Fields: {', '.join(result.fields_missing)}")
 
             if result.warnings:
-                report_lines.append("  Warnings:")
+                add("  Warnings:")
                 for warning in result.warnings:
-                    report_lines.append(f"    - {warning}")
+                    add(f"    - {warning}")
 
-            report_lines.append("")
+            add("")
+            yield lines
 
-        report_text = "\n".join(report_lines)
+    def generate_report(self, output_file: Optional[str] = None) -> Optional[str]:
+        """
+        Generate a validation report
 
-        # Write to file if specified
-        if output_file:
-            # Add 'bibtex_' prefix to filename if not already present
-            output_path = Path(output_file)
-            filename = output_path.name
-            if not filename.startswith("bibtex_"):
-                new_filename = "bibtex_" + filename
-                output_path = output_path.parent / new_filename
-            else:
-                output_path = Path(output_file)
+        Args:
+            output_file: If given, the report is streamed to this file one
+                entry at a time instead of being built in memory
+
+        Returns:
+            The report text, or None when it was written to output_file
+        """
+        if not output_file:
+            return "\n".join(
+                "\n".join(lines) for lines in self._report_blocks()
+            )
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(report_text)
-            print(f"Output written to {output_file}")
+        # Add 'bibtex_' prefix to filename if not already present
+        output_path = Path(output_file)
+        if not output_path.name.startswith("bibtex_"):
+            output_path = output_path.with_name("bibtex_" + output_path.name)
+
+        # Each block is encoded and written as it is formatted; the 1 MiB
+        # buffer batches the small writes
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            write = f.write
+            sep = ""
+            for lines in self._report_blocks():
+                write((sep + "\n".join(lines)).encode("utf-8"))
+                sep = "\n"
+        print(f"Output written to {output_file}")
+        return None
 
-        return report_text
+    def _order_fields(self, keys: List[str]) -> List[str]:
+        """
+        Order field names by PREFERRED_FIELD_ORDER, followed by any other
+        fields in their original order
+        """
+        # A pass over the short preference list replaces a keyed sort
+        key_set = set(keys)
+        preferred = self._field_order
+        ordered = [f for f in self.PREFERRED_FIELD_ORDER if f in key_set]
+        ordered += [k for k in keys if k not in preferred]
+        return ordered
 
     def reorder_fields(self):
         """Sort fields in all entries according to PREFERRED_FIELD_ORDER"""
+        system_keys = ("ID", "ENTRYTYPE")
         for i, entry in enumerate(self.db.entries):
             # Separate system keys from content keys
-            system_keys = ["ID", "ENTRYTYPE"]
             content_keys = [k for k in entry.keys() if k not in system_keys]
 
             # Sort content keys
-            sorted_content_keys = sorted(
-                content_keys,
-                key=lambda x: self.PREFERRED_FIELD_ORDER.index(x)
-                if x in self.PREFERRED_FIELD_ORDER
-                else 999,
-            )
+            sorted_content_keys = self._order_fields(content_keys)
 
             # Create new ordered dict (Python 3.7+ preserves insertion order)
             new_entry = {}
@@ -2516,39 +3591,53 @@ class BibTeXValidator:
             return entry
 
         entry_type = entry.get("ENTRYTYPE", "misc").lower()
-        allowed = self.ALLOWED_FIELDS.get(
-            entry_type, self.ALLOWED_FIELDS["misc"]
-        ).union(self.COMMON_FIELDS)
+        # Always keeps ID and ENTRYTYPE
+        allowed = self.KEPT_FIELDS_LOWER.get(
+            entry_type, self.KEPT_FIELDS_LOWER["misc"]
+        )
+        return {k: v for k, v in entry.items() if k.lower() in allowed}
 
-        # Always keep ID and ENTRYTYPE
-        allowed.add("ID")
-        allowed.add("ENTRYTYPE")
-        # Allowed add lower case
-        allowed = {k.lower() for k in allowed}
+    def _filter_and_reorder(self, entry: Dict) -> Dict:
+        """
+        Combined filter_entry_fields + reorder_fields for a single entry
 
-        filtered_entry = {}
-        for k, v in entry.items():
-            if k.lower() in allowed:
-                filtered_entry[k] = v
+        Keeps only the fields allowed for the entry type and returns them
+        in PREFERRED_FIELD_ORDER, with ID and ENTRYTYPE first.
+        """
+        entry_type = entry.get("ENTRYTYPE", "misc").lower()
+        allowed = self.KEPT_FIELDS_LOWER.get(
+            entry_type, self.KEPT_FIELDS_LOWER["misc"]
+        )
+        content_keys = self._order_fields(
+            [
+                k
+                for k in entry
+                if k != "ID" and k != "ENTRYTYPE" and k.lower() in allowed
+            ]
+        )
 
-        return filtered_entry
+        new_entry = {k: entry[k] for k in ("ID", "ENTRYTYPE") if k in entry}
+        for k in content_keys:
+            new_entry[k] = entry[k]
+        return new_entry
 
     def save_updated_bib(self, force=False):
         """Save updated BibTeX file"""
         if self.update_bib or force:
-            # Filter fields first
+            # Filter and sort fields in a single rewrite of each entry
             for i, entry in enumerate(self.db.entries):
-                self.db.entries[i] = self.filter_entry_fields(entry)
+                new_entry = self._filter_and_reorder(entry)
+                self.db.entries[i] = new_entry
+                self.db.entries_dict[entry["ID"]] = new_entry
 
             writer = BibTexWriter()
             writer.indent = "\t"
             writer.comma_first = False
 
-            # Ensure fields are sorted before saving
-            self.reorder_fields()
-
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                bibtexparser.dump(self.db, f, writer=writer)
+            # Rendered and encoded once, then written as a single binary write
+            bib_bytes = writer.write(self.db).encode("utf-8")
+            with open(self.output_file, "wb", buffering=1 << 20) as f:
+                f.write(bib_bytes)
             print(f"\nUpdated BibTeX file saved to: {self.output_file}")
 
 
@@ -2581,17 +3670,19 @@ def create_gui_app(
             "Install with: uv add fastapi uvicorn or pip install fastapi uvicorn"
         )
 
-    app = FastAPI(title="BibTeX Validator")
+    app = FastAPI(title="BibTeX Validator", default_response_class=JSONResponse)
+    # The page and the entry lists are large, repetitive text
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
 
     # Store validator and results in app state
     app.state.validator = validator
     app.state.results = results
+    # Per-key lookup for the entry endpoints (first result wins, as a scan would)
+    app.state.results_by_key = {r.entry_key: r for r in reversed(results)}
     app.state.accepted_changes = {}  # {entry_key: {field: new_value}}
 
-    # HTML page with inline CSS/JS
-    @app.get("/", response_class=HTMLResponse)
-    async def index():
-        return """
+    # HTML page with inline CSS/JS, encoded once per app
+    index_html = """
 <!DOCTYPE html>
 <html lang="en" class="light">
 <head>
@@ -3902,7 +4993,23 @@ def create_gui_app(
 </body>
 </html>
 
-        """
+        """.encode("utf-8")
+    index_etag = '"%s"' % hashlib.blake2b(index_html, digest_size=16).hexdigest()
+
+    @app.get("/", response_class=HTMLResponse)
+    async def index(request: Request):
+        # Browsers revalidate with the ETag and get a 304 for the unchanged page
+        headers = {"ETag": index_etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == index_etag:
+            return Response(status_code=304, headers=headers)
+        return HTMLResponse(content=index_html, headers=headers)
+
+    def _status_lists(result: ValidationResult) -> Dict[str, List[str]]:
+        """Field names per comparison status, as the front end expects them"""
+        lists = {name: [] for name in STATUS_KEYS.values()}
+        for f_name, diff in result.field_status.items():
+            lists[STATUS_KEYS[diff.status]].append(f_name)
+        return lists
 
     # API: Get list of entries
     @app.get("/api/entries")
@@ -3918,10 +5025,7 @@ def create_gui_app(
                     "doi_valid": result.doi_valid,
                     "has_arxiv": result.has_arxiv,
                     "arxiv_valid": result.arxiv_valid,
-                    "fields_updated": list(result.fields_updated.keys()),
-                    "fields_conflict": list(result.fields_conflict.keys()),
-                    "fields_different": list(result.fields_different.keys()),
-                    "fields_identical": list(result.fields_identical.keys()),
+                    **_status_lists(result),
                 }
             )
         return {"entries": entries}
@@ -3941,7 +5045,7 @@ def create_gui_app(
             # Conflicts might be risky, but let's assume 'Accept All' means 'Trust API'.
 
             # Re-calculate or use stored result.
-            # The result object has 'fields_updated', 'fields_conflict', etc. properties
+            # The result object has per-field statuses in 'field_status'.
             # BUT these are computed on the fly in the validation loop usually.
             # Here 'results' list contains the ValidationResult objects generated at startup.
             # However, if we saved changes, we updated the DB but maybe not the Result object fully?
@@ -3956,19 +5060,11 @@ def create_gui_app(
             changes_to_apply = {}
 
             # 1. Updates (New fields)
-            for f_name, change in result.fields_updated.items():
-                changes_to_apply[f_name] = change
-
             # 2. Differences (Value diff)
-            for f_name, change in result.fields_different.items():
-                # change is usually (bib_val, api_val)
-                if isinstance(change, (list, tuple)) and len(change) >= 2:
-                    changes_to_apply[f_name] = change[1]
-
             # 3. Conflicts (BibTeX vs API) -> Default to API for "Accept All"
-            for f_name, change in result.fields_conflict.items():
-                if isinstance(change, (list, tuple)) and len(change) >= 2:
-                    changes_to_apply[f_name] = change[1]
+            for status in ("updated", "different", "conflict"):
+                for f_name, diff in result.fields_with(status).items():
+                    changes_to_apply[f_name] = diff.api
 
             if changes_to_apply:
                 # Apply to DB
@@ -3980,14 +5076,10 @@ def create_gui_app(
                         else:
                             entry[k] = v
                         # Add to identical fields for stats update
-                        result.fields_identical[k] = v
+                        source = result.field_sources.get(k)
+                        result.field_status[k] = FieldDiff("identical", v, v, source)
                     modified_count += 1
 
-                    # Clear the pending changes in the result object so UI updates
-                    result.fields_updated = {}
-                    result.fields_conflict = {}
-                    result.fields_different = {}
-
         # Save to file
         validator.save_updated_bib(force=True)
 
@@ -4001,10 +5093,7 @@ def create_gui_app(
                     "doi_valid": res.doi_valid,
                     "has_arxiv": res.has_arxiv,
                     "arxiv_valid": res.arxiv_valid,
-                    "fields_updated": list(res.fields_updated.keys()),
-                    "fields_conflict": list(res.fields_conflict.keys()),
-                    "fields_different": list(res.fields_different.keys()),
-                    "fields_identical": list(res.fields_identical.keys()),
+                    **_status_lists(res),
                 }
             )
 
@@ -4030,9 +5119,8 @@ def create_gui_app(
             raise HTTPException(status_code=400, detail="Invalid entry_key")
 
         validator = app.state.validator
-        results = app.state.results
 
-        result = next((r for r in results if r.entry_key == entry_key), None)
+        result = app.state.results_by_key.get(entry_key)
         if not result:
             raise HTTPException(status_code=404, detail="Entry not found")
 
@@ -4057,46 +5145,31 @@ def create_gui_app(
         for source_name, source_data in result.all_sources_data.items():
             comparison["all_sources_data"][source_name] = source_data
 
-        # Process updates
-        if result.fields_updated:
-            for f_name, new_val in result.fields_updated.items():
-                if f_name and new_val is not None:
-                    # Use original_values for old (original BibTeX value)
-                    # This ensures Reject can restore to the original value
-                    old_value = result.original_values.get(
-                        f_name, entry.get(f_name, "") or ""
-                    )
-                    comparison["fields_updated"][f_name] = {
-                        "old": old_value,
-                        "new": str(new_val) if new_val is not None else "",
-                    }
-
-        # Process conflicts
-        if result.fields_conflict:
-            for f_name, conflict_data in result.fields_conflict.items():
-                if f_name and conflict_data and len(conflict_data) >= 2:
-                    bib_val, api_val = conflict_data[0], conflict_data[1]
-                    comparison["fields_conflict"][f_name] = {
-                        "bibtex": str(bib_val) if bib_val is not None else "",
-                        "api": str(api_val) if api_val is not None else "",
-                    }
-
-        # Process identical fields
-        if result.fields_identical:
-            for f_name, value in result.fields_identical.items():
-                comparison["fields_identical"][f_name] = (
-                    str(value) if value is not None else ""
+        # Process field comparisons, grouped by status
+        for f_name, diff in result.field_status.items():
+            if not f_name:
+                continue
+            bib_val = str(diff.bib) if diff.bib is not None else ""
+            api_val = str(diff.api) if diff.api is not None else ""
+            if diff.status == "updated":
+                if diff.api is None:
+                    continue
+                # Use original_values for old (original BibTeX value)
+                # This ensures Reject can restore to the original value
+                old_value = result.original_values.get(
+                    f_name, entry.get(f_name, "") or ""
                 )
-
-        # Process different fields
-        if result.fields_different:
-            for field, diff_data in result.fields_different.items():
-                if field and diff_data and len(diff_data) >= 2:
-                    bib_val, api_val = diff_data[0], diff_data[1]
-                    comparison["fields_different"][field] = {
-                        "bibtex": str(bib_val) if bib_val is not None else "",
-                        "api": str(api_val) if api_val is not None else "",
-                    }
+                comparison["fields_updated"][f_name] = {
+                    "old": old_value,
+                    "new": api_val,
+                }
+            elif diff.status == "identical":
+                comparison["fields_identical"][f_name] = bib_val
+            else:
+                comparison[STATUS_KEYS[diff.status]][f_name] = {
+                    "bibtex": bib_val,
+                    "api": api_val,
+                }
 
         # Process sources
         comparison["field_sources"] = result.field_sources.copy()
@@ -4136,13 +5209,12 @@ def create_gui_app(
             )
 
         validator = app.state.validator
-        results = app.state.results
 
         entry = next((e for e in validator.db.entries if e["ID"] == entry_key), None)
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
 
-        result = next((r for r in results if r.entry_key == entry_key), None)
+        result = app.state.results_by_key.get(entry_key)
         if not result:
             raise HTTPException(status_code=404, detail="Result not found")
 
@@ -4166,13 +5238,14 @@ def create_gui_app(
         # Update stats (remove from identical, add back to updated/conflict/diff?)
         # This is complex because we need to know what the API value was to re-categorize it.
         # Ideally we just undo the 'identical' mark.
-        if field_to_restore in result.fields_identical:
-            del result.fields_identical[field_to_restore]
+        diff = result.field_status.get(field_to_restore)
+        if diff is not None and diff.status == "identical":
+            del result.field_status[field_to_restore]
 
         # Manually re-trigger comparison logic?
         # Or just client side re-render will fetch comparison again?
         # The comparison logic is in Python. We need to re-run compare_fields or rely on stored diffs.
-        # Stored diffs (fields_updated etc) were CLEARED upon accept.
+        # Stored diffs (field_status) were CLEARED upon accept.
         # So we MUST recover them.
         # BUT we don't store "cleared" diffs.
         # Only option: Re-run validation for this entry?
@@ -4195,7 +5268,7 @@ def create_gui_app(
         # validate_entry fetches fresh data.
         # To optimize, we could check if we have data.
         # Actually, for "undo", we mainly want the UI to go back.
-        # If we re-validate, we get fresh 'fields_updated' etc.
+        # If we re-validate, we get a fresh 'field_status'.
 
         new_res = validator.validate_entry(entry)
 
@@ -4205,9 +5278,11 @@ def create_gui_app(
         # 'entry' is now restored to original state (mostly).
         # So safe.
 
-        # Replace result in list
+        # Replace result in list and in the per-key lookup
+        results = app.state.results
         index = results.index(result)
         results[index] = new_res
+        app.state.results_by_key[entry_key] = new_res
 
         validator.save_updated_bib(force=True)
 
@@ -4217,16 +5292,14 @@ def create_gui_app(
     async def reject_all_global():
         """Reject all updates (clears suggestions)"""
         # "Reject All" means we discard the suggestions and keep local values.
-        # Effectively, we just clear the 'fields_updated', 'conflict', 'different' lists in the results.
+        # Effectively, we just clear the updated/conflict/different statuses in the results.
         # We DO NOT modify the DB (since local values are already there).
         # We DO NOT save to file (nothing changed).
 
         results = app.state.results
         for result in results:
-            result.fields_updated = {}
-            result.fields_conflict = {}
-            result.fields_different = {}
             # identical remains identical
+            result.clear_suggestions()
 
         return {"success": True, "count": len(results)}
 
@@ -4252,13 +5325,12 @@ def create_gui_app(
             )
 
         validator = app.state.validator
-        results = app.state.results
 
         entry = next((e for e in validator.db.entries if e["ID"] == entry_key), None)
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
 
-        result = next((r for r in results if r.entry_key == entry_key), None)
+        result = app.state.results_by_key.get(entry_key)
         if not result:
             raise HTTPException(status_code=404, detail="Result not found")
 
@@ -4277,18 +5349,10 @@ def create_gui_app(
         for f_name in accepted_fields:
             if not isinstance(f_name, str) or not f_name:
                 continue  # Skip invalid field names
-            if f_name in result.fields_updated:
-                app.state.accepted_changes[entry_key][f_name] = result.fields_updated[
-                    f_name
-                ]
-                accepted_count += 1
-            elif (
-                f_name in result.fields_conflict
-                and len(result.fields_conflict[f_name]) >= 2
-            ):
-                app.state.accepted_changes[entry_key][f_name] = result.fields_conflict[
-                    f_name
-                ][1]  # API value
+            diff = result.field_status.get(f_name)
+            if diff is not None and diff.status in ("updated", "conflict"):
+                # API value
+                app.state.accepted_changes[entry_key][f_name] = diff.api
                 accepted_count += 1
 
         return JSONResponse(
@@ -4321,13 +5385,12 @@ def create_gui_app(
             )
 
         validator = app.state.validator
-        results = app.state.results
 
         entry = next((e for e in validator.db.entries if e["ID"] == entry_key), None)
         if not entry:
             raise HTTPException(status_code=404, detail="Entry not found")
 
-        result = next((r for r in results if r.entry_key == entry_key), None)
+        result = app.state.results_by_key.get(entry_key)
         if not result:
             raise HTTPException(status_code=404, detail="Result not found")
 
@@ -4342,29 +5405,18 @@ def create_gui_app(
 
             # Find the original BibTeX value
             original_bibtex_value = None
+            diff = result.field_status.get(f_name)
+            status = diff.status if diff is not None else None
 
-            # Check fields_conflict (first element is the original BibTeX value)
-            if (
-                f_name in result.fields_conflict
-                and len(result.fields_conflict[f_name]) >= 2
-            ):
-                original_bibtex_value = result.fields_conflict[f_name][
-                    0
-                ]  # bibtex value
-            # Check fields_different (first element is the original BibTeX value)
-            elif (
-                f_name in result.fields_different
-                and len(result.fields_different[f_name]) >= 2
-            ):
-                original_bibtex_value = result.fields_different[f_name][
-                    0
-                ]  # bibtex value
-            # For fields_updated, use original_values (stored at validation time)
+            # Conflicts and differences carry the original BibTeX value
+            if status in ("conflict", "different"):
+                original_bibtex_value = diff.bib
+            # For updated fields, use original_values (stored at validation time)
             elif f_name in result.original_values:
                 original_bibtex_value = result.original_values[f_name]
-            # If field was in fields_updated but not in original_values,
+            # If field was updated but not in original_values,
             # it means the field was missing originally, so delete it
-            elif f_name in result.fields_updated:
+            elif status == "updated":
                 # Field was missing, so delete it
                 if f_name in entry:
                     del entry[f_name]
@@ -4380,6 +5432,7 @@ def create_gui_app(
 
         # Apply accepted fields
         applied_count = 0
+        comparisons = {}  # source -> compare_fields result, computed once
         for f_name in accepted_fields:
             if not isinstance(f_name, str) or not f_name:
                 continue  # Skip invalid field names
@@ -4388,69 +5441,40 @@ def create_gui_app(
             selected_source = selected_sources.get(f_name)
             if selected_source and selected_source in result.all_sources_data:
                 # Use value from selected source
-                source_data = result.all_sources_data[selected_source]
                 # Extract field value from source data using compare_fields logic
-                comparison = validator.compare_fields(
-                    entry, source_data, source=selected_source
-                )
-                # Get the value from comparison results
-                # Get the value from comparison results
-                if f_name in comparison["updated"]:
-                    if f_name == "entrytype":
-                        entry["ENTRYTYPE"] = comparison["updated"][f_name]
-                    else:
-                        entry[f_name] = comparison["updated"][f_name]
-                    applied_count += 1
-                elif f_name in comparison["conflicts"]:
-                    if f_name == "entrytype":
-                        entry["ENTRYTYPE"] = comparison["conflicts"][f_name][1]
-                    else:
-                        entry[f_name] = comparison["conflicts"][f_name][1]  # API value
-                    applied_count += 1
-                elif f_name in comparison.get("different", {}):
+                comparison = comparisons.get(selected_source)
+                if comparison is None:
+                    comparison = validator.compare_fields(
+                        entry,
+                        result.all_sources_data[selected_source],
+                        source=selected_source,
+                    )
+                    comparisons[selected_source] = comparison
+                # Get the API value from comparison results
+                source_diff = comparison["field_status"].get(f_name)
+                if source_diff is not None:
                     if f_name == "entrytype":
-                        entry["ENTRYTYPE"] = comparison["different"][f_name][1]
+                        entry["ENTRYTYPE"] = source_diff.api
                     else:
-                        entry[f_name] = comparison["different"][f_name][1]  # API value
+                        entry[f_name] = source_diff.api
                     applied_count += 1
-                elif f_name in comparison.get("identical", {}):
+            else:
+                diff = result.field_status.get(f_name)
+                if diff is not None and diff.status in (
+                    "updated",
+                    "conflict",
+                    "different",
+                ):
                     if f_name == "entrytype":
-                        entry["ENTRYTYPE"] = comparison["identical"][f_name]
+                        entry["ENTRYTYPE"] = diff.api
                     else:
-                        entry[f_name] = comparison["identical"][f_name]
+                        entry[f_name] = diff.api  # API value
                     applied_count += 1
-            elif f_name in result.fields_updated:
-                if f_name == "entrytype":
-                    entry["ENTRYTYPE"] = result.fields_updated[f_name]
-                else:
-                    entry[f_name] = result.fields_updated[f_name]
-                applied_count += 1
-            elif (
-                f_name in result.fields_conflict
-                and len(result.fields_conflict[f_name]) >= 2
-            ):
-                if f_name == "entrytype":
-                    entry["ENTRYTYPE"] = result.fields_conflict[f_name][1]
-                else:
-                    entry[f_name] = result.fields_conflict[f_name][1]  # API value
-                applied_count += 1
-            elif (
-                f_name in result.fields_different
-                and len(result.fields_different[f_name]) >= 2
-            ):
-                if f_name == "entrytype":
-                    entry["ENTRYTYPE"] = result.fields_different[f_name][1]
-                else:
-                    entry[f_name] = result.fields_different[f_name][1]  # API value
-                applied_count += 1
 
             # Remove from pending changes in result object so it's not suggested again
-            if f_name in result.fields_updated:
-                del result.fields_updated[f_name]
-            if f_name in result.fields_conflict:
-                del result.fields_conflict[f_name]
-            if f_name in result.fields_different:
-                del result.fields_different[f_name]
+            diff = result.field_status.get(f_name)
+            if diff is not None and diff.status != "identical":
+                del result.field_status[f_name]
 
         if applied_count == 0 and restored_count == 0:
             return JSONResponse(
@@ -4529,6 +5553,8 @@ def gui_app_factory():
             output_file=state["output_file"],
             update_bib=False,  # dummy
             delay=1.0,
+            use_cache=state["use_cache"],
+            mailto=state["mailto"],
         )
         validator.db = state["db"]
         results = state["results"]
@@ -4602,6 +5628,15 @@ Examples:
     parser.add_argument(
         "--port", type=int, default=8010, help="Port for GUI web server (default: 8010)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the on-disk API response cache",
+    )
+    parser.add_argument(
+        "--mailto",
+        help="Contact e-mail for the Crossref polite pool (default: $CROSSREF_MAILTO)",
+    )
 
     args = parser.parse_args()
 
@@ -4612,6 +5647,8 @@ Examples:
             output_file=args.output,
             update_bib=args.update,
             delay=args.delay,
+            use_cache=not args.no_cache,
+            mailto=args.mailto,
         )
 
         # Validate all entries
@@ -4663,6 +5700,8 @@ Examples:
                 state = {
                     "bib_file": str(validator.bib_file),
                     "output_file": str(validator.output_file),
+                    "use_cache": not args.no_cache,
+                    "mailto": validator.mailto,
                     "db": validator.db,
                     "results": validator.results,
                 }
@@ -4733,8 +5772,7 @@ Examples:
         if report_file:
             report_path = Path(report_file)
             if not report_path.name.startswith("bibtex_"):
-                report_path = report_path.parent / ("bibtex_" + report_path.name)
-                report_file = str(report_path)
+                report_file = str(report_path.with_name("bibtex_" + report_path.name))
 
         report_text = validator.generate_report(output_file=report_file)
 